@@ -19,7 +19,7 @@
     'version': '0.1',
 
     # any module necessary for this one to work correctly
-    'depends': ['base', 'calendar', 'mail', 'contacts', 'website'],
+    'depends': ['base', 'calendar', 'mail', 'contacts', 'website', 'outbound_http'],
 
     'external_dependencies': {
         'python': ['requests', 'pytz', 'urllib3'],
@@ -39,6 +39,7 @@
         'data/cron_job.xml',
         'views/portal_templates.xml',
         'views/contact_templates.xml',
+        'views/invitation_templates.xml',
     ],
 
 }
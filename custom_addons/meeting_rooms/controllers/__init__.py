@@ -1,3 +1,5 @@
 from . import website
 from . import booking_portal
-from . import contact_portal
\ No newline at end of file
+from . import contact_portal
+from . import calendar_feed
+from . import zoom_webhook
\ No newline at end of file
@@ -7,9 +7,17 @@ import base64
 import re
 from werkzeug.utils import redirect
 import logging
+import hashlib
+import json
+
+from ..models.availability import free_slots
+from ..models import tz_service
 
 _logger = logging.getLogger(__name__)
 
+# Days shown per page of the booking calendar (server-rendered first page + JSON pages)
+DAYS_PER_PAGE = 7
+
 class BookingPortal(http.Controller):
 
     # =========================================================================
@@ -56,91 +64,138 @@ class BookingPortal(http.Controller):
             return "ERROR: Booking link does not have timezone configured."
         
         try:
-            host_tz = pytz.timezone(target_tz_name)
+            host_tz = tz_service.get_tz(target_tz_name)
         except:
             return f"ERROR: Invalid timezone '{target_tz_name}'."
 
-        # Setup Time
-        now_utc = datetime.now(pytz.utc)
-        now_host = now_utc.astimezone(host_tz)
-        
-        # === QUERY OPTIMIZATION (SCALABILITY FIX) ===
-        # Instead of querying search_count in loop (48x per page),
-        # we query once upfront and cache results in RAM.
-        # Fetch all confirmed meetings for host in 7-day window.
-        
-        window_start_utc = now_utc.replace(tzinfo=None)
-        window_end_utc = (now_utc + timedelta(days=7)).replace(tzinfo=None)
-        
-        MeetingEvent = request.env['meeting.event'].sudo()
-        
-        # SINGLE QUERY: Fetch all events in the 7-day window
-        existing_events = MeetingEvent.search([
-            ('start_date', '<', window_end_utc),
-            ('end_date', '>', window_start_utc),
-            ('state', '=', 'confirm'),
-            ('attendee', 'in', [host_user.id])
-        ])
-        
-        # Cache busy slots in RAM as list of tuples
-        # Format: [(start_utc, end_utc), (start_utc, end_utc), ...]
-        busy_slots_cache = []
-        for ev in existing_events:
-            busy_slots_cache.append((ev.start_date, ev.end_date))
-        
-        # === END OPTIMASI ===
-        
-        dates = []
-        
-        # Generate next 6 days
-        for i in range(6): 
-            current_date_host = now_host.date() + timedelta(days=i)
-            day_slots = []
-            
-            for hour in range(9, 17): 
-                # 1. Create Timestamp in LINK TIMEZONE
-                slot_naive = datetime.combine(current_date_host, time(hour, 0, 0))
-                slot_aware_host = host_tz.localize(slot_naive)
-                
-                # Skip past times
-                if slot_aware_host < now_host:
-                    continue
-
-                # 2. Convert to UTC (Naive) for Comparison
-                slot_aware_utc = slot_aware_host.astimezone(pytz.utc)
-                end_aware_utc = slot_aware_utc + timedelta(hours=1)
-
-                db_start = slot_aware_utc.replace(tzinfo=None)
-                db_end = end_aware_utc.replace(tzinfo=None)
-
-                # 3. CHECK FOR CONFLICT IN RAM (Fast & CPU-efficient - No DB query)
-                is_busy = False
-                for b_start, b_end in busy_slots_cache:
-                    # Overlap logic: (StartA < EndB) and (EndA > StartB)
-                    if db_start < b_end and db_end > b_start:
-                        is_busy = True
-                        break
-                
-                if not is_busy:
-                    local_val = slot_naive.strftime('%Y-%m-%d %H:%M:%S')
-                    day_slots.append({
-                        'time_str': f"{hour:02d}:00", 
-                        'val': local_val
-                    })
-
-            if day_slots:
-                dates.append({
-                    'date_str': current_date_host.strftime('%A, %d %b'),
-                    'slots': day_slots
-                })
+        # === AVAILABILITY ENGINE ===
+        # Only the first page (one week) is rendered server-side; later weeks
+        # are loaded lazily from /book/<token>/availability.json.
+        template = link_obj.get_schedule_template()
+        week_data = self._compute_week(link_obj, host_tz, template, 0)
+        dates = week_data['dates'] if week_data else []
 
         return request.render('meeting_rooms.portal_booking_template', {
             'host': host_user,
             'dates': dates,
             'token': token,
             'tz_name': target_tz_name,
+            'slot_duration': template.slot_minutes,
+            'has_next': bool(week_data and week_data['has_next']),
         })
 
+    # =========================================================================
+    # 1b. Availability JSON (lazy week pagination, ETag / 304 revalidation)
+    # =========================================================================
+    @http.route('/book/<string:token>/availability.json', type='http', auth='public', methods=['GET'])
+    def booking_availability_json(self, token, week=0, **kw):
+        link_obj = request.env['meeting.booking.link'].sudo().search([
+            ('token', '=', token),
+            ('active', '=', True)
+        ], limit=1)
+        if not link_obj:
+            return request.not_found()
+
+        try:
+            week = int(week)
+            host_tz = tz_service.get_tz(link_obj.tz or link_obj.user_id.tz or 'UTC')
+        except (ValueError, pytz.UnknownTimeZoneError):
+            return request.not_found()
+
+        template = link_obj.get_schedule_template()
+        week_data = self._compute_week(link_obj, host_tz, template, week,
+                                       if_none_match=request.httprequest.if_none_match)
+        if not week_data:
+            return request.not_found()
+
+        headers = [
+            ('ETag', '"%s"' % week_data['etag']),
+            ('Cache-Control', 'public, no-cache'),
+            ('Vary', 'Accept-Encoding'),
+        ]
+        if week_data['not_modified']:
+            response = request.make_response('', headers)
+            response.status_code = 304
+            return response
+
+        payload = {
+            'tz': host_tz.zone,
+            'slot': template.slot_minutes,
+            'week': week,
+            'has_prev': week > 0,
+            'has_next': week_data['has_next'],
+            'days': [{
+                'date': day['date'],
+                'label': day['date_str'],
+                'slots': [slot['time_str'] for slot in day['slots']],
+            } for day in week_data['dates']],
+        }
+        body = json.dumps(payload, separators=(',', ':'))
+        return request.make_response(body, headers + [('Content-Type', 'application/json; charset=utf-8')])
+
+    def _compute_week(self, link_obj, host_tz, template, week, if_none_match=None):
+        """
+        Compute one page (7 local days) of free slots for a booking link.
+
+        The ETag only depends on cheap inputs: the host's free/busy projection
+        version, the link's schedule fingerprint, the page and how many of
+        today's slots already passed. It is checked against if_none_match
+        with a single version lookup, before any busy interval is read or
+        any slot is built.
+
+        Args:
+            link_obj: meeting.booking.link record (sudo)
+            host_tz: pytz timezone of the link
+            template: availability.ScheduleTemplate of the link
+            week: Page index, 0 = starting today
+            if_none_match: Optional werkzeug ETags sent by the client
+
+        Returns:
+            dict with 'etag', 'has_next', 'not_modified' and 'dates' (absent when
+            not modified), or None if out of horizon
+        """
+        first_day = week * DAYS_PER_PAGE
+        if week < 0 or first_day >= template.horizon_days:
+            return None
+        last_day = min(first_day + DAYS_PER_PAGE, template.horizon_days)
+
+        now_utc = datetime.now(pytz.utc)
+        now_host = now_utc.astimezone(host_tz)
+        today = now_host.date()
+        page_start = host_tz.localize(datetime.combine(today + timedelta(days=first_day), time(0, 0)))
+        page_end = host_tz.localize(datetime.combine(today + timedelta(days=last_day), time(0, 0)))
+        window_start_utc = max(now_utc, page_start).astimezone(pytz.utc).replace(tzinfo=None)
+        window_end_utc = page_end.astimezone(pytz.utc).replace(tzinfo=None)
+        passed = template.count_passed(now_host.replace(tzinfo=None)) if week == 0 else 0
+
+        def _etag(version):
+            return hashlib.sha1(repr((
+                link_obj.id, host_tz.zone, template.fingerprint, version, week, today.isoformat(), passed,
+            )).encode()).hexdigest()
+
+        Event = request.env['meeting.event'].sudo()
+        result = {'has_next': last_day < template.horizon_days}
+        if if_none_match:
+            result['etag'] = _etag(Event._get_busy_version(link_obj.user_id))
+            if if_none_match.contains(result['etag']):
+                result['not_modified'] = True
+                return result
+
+        version, busy_index = Event._get_busy_snapshot(
+            link_obj.user_id, window_start_utc, window_end_utc, padding=template.buffer_delta
+        )
+        # The projection may have moved on since the lookup above
+        result.update(etag=_etag(version), not_modified=False)
+        result['dates'] = [{
+            'date': day.isoformat(),
+            'date_str': day.strftime('%A, %d %b'),
+            'slots': [{
+                'time_str': slot_naive.strftime('%H:%M'),
+                'val': slot_naive.strftime('%Y-%m-%d %H:%M:%S'),
+            } for slot_naive, _start, _end in day_slots],
+        } for day, day_slots in free_slots(busy_index, host_tz, window_start_utc, window_end_utc, template)]
+        return result
+
     # =========================================================================
     # 2. Details form 
     # =========================================================================
@@ -158,7 +213,7 @@ class BookingPortal(http.Controller):
             # Parse LOCAL string (Link timezone)
             dt_naive = datetime.strptime(time_str.strip(), '%Y-%m-%d %H:%M:%S')
             
-            target_tz = pytz.timezone(target_tz_name)
+            target_tz = tz_service.get_tz(target_tz_name)
             
             # Make timezone-aware (Local Link Time)
             local_aware = target_tz.localize(dt_naive)
@@ -220,12 +275,18 @@ class BookingPortal(http.Controller):
         # TIMEZONE CONVERSION LOGIC
         try:
             local_dt_naive = datetime.strptime(time_str.strip(), '%Y-%m-%d %H:%M:%S')
-            target_tz = pytz.timezone(target_tz_name)
+            target_tz = tz_service.get_tz(target_tz_name)
             local_dt_aware = target_tz.localize(local_dt_naive)
             utc_dt_aware = local_dt_aware.astimezone(pytz.utc)
             
+            template = link_obj.get_schedule_template()
+            if not template.is_slot_start(local_dt_naive):
+                return "Invalid time slot for this booking link."
+
             start_dt_db = utc_dt_aware.replace(tzinfo=None)
-            end_dt_db = start_dt_db + timedelta(hours=1)
+            end_dt_db = start_dt_db + template.slot_delta
+            if start_dt_db < datetime.utcnow() or local_dt_naive.date() >= datetime.now(target_tz).date() + timedelta(days=template.horizon_days):
+                return "This time slot is outside the booking window."
             
             client_ip = request.httprequest.remote_addr
             _logger.info(f"BOOKING SECURED: User '{kw.get('name')}' | IP {client_ip} | Time {start_dt_db} UTC")
@@ -251,14 +312,11 @@ class BookingPortal(http.Controller):
                 'type': 'contact'
             })
 
-        # Check for Conflict
-        domain = [
-            ('start_date', '<', end_dt_db),
-            ('end_date', '>', start_dt_db),
-            ('attendee', 'in', [host_user.id]),
-            ('state', '=', 'confirm')
-        ]
-        if request.env['meeting.event'].sudo().search_count(domain) > 0:
+        # Check for Conflict (same availability engine as the calendar page)
+        busy_index = request.env['meeting.event'].sudo()._get_busy_index(
+            host_user, start_dt_db, end_dt_db, padding=template.buffer_delta
+        )
+        if busy_index.overlaps(start_dt_db, end_dt_db):
             return "Sorry, this time slot has just been booked."
 
         # Create Event as HOST user (so host_user is the creator, not public user)
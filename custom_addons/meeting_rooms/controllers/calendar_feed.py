@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+from odoo import http
+from odoo.http import request
+from odoo.tools import consteq
+from werkzeug.http import http_date
+
+
+class CalendarFeed(http.Controller):
+
+    # =========================================================================
+    # Subscribable iCalendar feeds (conditional GET: ETag / Last-Modified)
+    # =========================================================================
+    @http.route('/meeting/feed/user/<string:token>.ics', type='http', auth='public', methods=['GET', 'HEAD'])
+    def meeting_feed_user(self, token, **kw):
+        user = request.env['res.users'].sudo().search([('meeting_feed_token', '=', token)], limit=1) if token else None
+        if not user:
+            return request.not_found()
+        return self._feed_response(
+            'user:%s' % user.id,
+            request.env['meeting.calendar.feed'].sudo()._feed_domains(user=user),
+            user.tz or 'UTC',
+            user.name,
+        )
+
+    @http.route('/meeting/feed/room/<int:room_id>.ics', type='http', auth='public', methods=['GET', 'HEAD'])
+    def meeting_feed_room(self, room_id, token=None, **kw):
+        room = request.env['room.location'].sudo().browse(room_id).exists()
+        if not room or not room.feed_token or not token or not consteq(room.feed_token, token):
+            return request.not_found()
+        return self._feed_response(
+            'room:%s' % room.id,
+            request.env['meeting.calendar.feed'].sudo()._feed_domains(room=room),
+            room.tz or 'UTC',
+            room.name,
+        )
+
+    def _feed_response(self, key, domains, tz_name, name):
+        Feed = request.env['meeting.calendar.feed'].sudo()
+        etag, last_modified = Feed._feed_validators(domains, key)
+        headers = [
+            ('ETag', '"%s"' % etag),
+            ('Cache-Control', 'private, no-cache'),
+        ]
+        if last_modified:
+            headers.append(('Last-Modified', http_date(last_modified)))
+
+        # If-None-Match takes precedence over If-Modified-Since (RFC 7232 section 6)
+        httprequest = request.httprequest
+        if httprequest.if_none_match:
+            not_modified = httprequest.if_none_match.contains(etag)
+        else:
+            since = httprequest.if_modified_since
+            not_modified = bool(since and last_modified and
+                                last_modified.replace(microsecond=0) <= since.replace(tzinfo=None))
+        if not_modified:
+            response = request.make_response('', headers)
+            response.status_code = 304
+            return response
+
+        body = Feed._feed_render(domains, tz_name, name)
+        return request.make_response(body, headers + [
+            ('Content-Type', 'text/calendar; charset=utf-8'),
+            ('Content-Disposition', 'inline; filename="%s.ics"' % key.replace(':', '_')),
+        ])
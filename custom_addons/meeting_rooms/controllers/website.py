@@ -7,6 +7,9 @@ from odoo.http import request
 import pytz
 import base64
 
+from ..models.invitation_renderer import render_static, personalize
+from ..models import tz_service
+
 
 class MeetingRoomsWebsite(http.Controller):
     def _get_host_tz_name(self, meeting):
@@ -18,12 +21,7 @@ class MeetingRoomsWebsite(http.Controller):
         return 'UTC'
 
     def _convert_utc_to_tz(self, dt, tz_name):
-        if not dt:
-            return dt
-        tz = pytz.timezone(tz_name or 'UTC')
-        if dt.tzinfo is None:
-            dt = pytz.utc.localize(dt)
-        return dt.astimezone(tz)
+        return tz_service.to_local(dt, tz_name)
 
     @http.route('/create-icalendar', auth='user', website=True)
     def create_icalendar(self, **kw):
@@ -58,34 +56,8 @@ class MeetingRoomsWebsite(http.Controller):
         file_name = kw.get("calendar_name")
         meeting_id = int(kw.get("meeting_id"))
         files = base64.b64encode(file.read())
-        attachment = None
-        attachment_calendar = request.env['ir.attachment'].sudo().search(
-            [('res_model', '=', 'meeting.rooms'), ('type', '=', 'binary'), ('res_field', '=', 'calendar_file'),
-             ('res_id', '=', meeting_id)])
-        if attachment_calendar:
-            attachment_calendar.unlink()
-            attachment = request.env['ir.attachment'].sudo().create({
-                'name': file_name,
-                'type': 'binary',
-                'res_model': 'meeting.rooms',
-                'res_field': 'calendar_file',
-                'res_id': meeting_id,
-                'res_name': file_name,
-                'datas': files,
-                'public': True
-            })
-        else:
-            attachment = request.env['ir.attachment'].sudo().create({
-                'name': file_name,
-                'type': 'binary',
-                'res_model': 'meeting.rooms',
-                'res_field': 'calendar_file',
-                'res_id': meeting_id,
-                'res_name': file_name,
-                'datas': files,
-                'public': True
-            })
         record = request.env['meeting.rooms'].sudo().browse(meeting_id)
+        attachment = record._upsert_calendar_attachment(file_name, files)
         host_tz_name = self._get_host_tz_name(record)
         start_time = self._convert_utc_to_tz(record.start_date, host_tz_name)
         end_time = self._convert_utc_to_tz(record.end_date, host_tz_name)
@@ -109,95 +81,64 @@ class MeetingRoomsWebsite(http.Controller):
         # Get all recipients
         all_recipients = [record.create_uid] + list(record.attendee)
         
+        # UTC times (absolute reference)
+        utc_start_str = tz_service.format_utc(record.start_date, '%Y-%m-%d %H:%M:%S')
+        utc_end_str = tz_service.format_utc(record.end_date, '%Y-%m-%d %H:%M:%S')
+
+        # Build timezone breakdown table
+        tz_breakdown = "<table style=\"width:100%; font-size:13px; color:#444; border:1px solid #ddd; background-color:#f9f9f9; margin-top:15px;\">"
+        tz_breakdown += "<tr style=\"background-color:#e8e8e8;\"><th style=\"padding:8px; text-align:left;\">Location</th><th style=\"padding:8px; text-align:left;\">Local Time</th></tr>"
+        
+        # Add room locations
+        if record.room_location:
+            room_tz = record.room_location.tz if hasattr(record.room_location, 'tz') and record.room_location.tz else host_tz_name
+            room_start = self._convert_utc_to_tz(record.start_date, room_tz)
+            room_end = self._convert_utc_to_tz(record.end_date, room_tz)
+            room_start_time = room_start.strftime('%H:%M')
+            room_end_time = room_end.strftime('%H:%M')
+            tz_breakdown += f"<tr><td style=\"padding:8px; border-bottom:1px solid #ddd;\">🏢 {record.room_location.name}</td><td style=\"padding:8px; border-bottom:1px solid #ddd;\"><b>{room_start_time} - {room_end_time}</b> <span style=\"color:#888; font-size:11px;\">({room_tz})</span></td></tr>"
+        
+        # Add virtual room if exists
+        event = getattr(record, 'meeting_event_id', False)
+        if event and (event.zoom_link or event.virtual_room_id):
+            virtual_tz = event.host_user_id.tz if event.host_user_id and event.host_user_id.tz else host_tz_name
+            virtual_start = self._convert_utc_to_tz(record.start_date, virtual_tz)
+            virtual_end = self._convert_utc_to_tz(record.end_date, virtual_tz)
+            virtual_start_time = virtual_start.strftime('%H:%M')
+            virtual_end_time = virtual_end.strftime('%H:%M')
+            provider_name = "Virtual Room"
+            if event.virtual_room_id:
+                provider_name = event.virtual_room_id.provider.replace('_', ' ').title() if event.virtual_room_id.provider else "Virtual Room"
+            tz_breakdown += f"<tr><td style=\"padding:8px; border-bottom:1px solid #ddd;\">🎥 {provider_name} (Host)</td><td style=\"padding:8px; border-bottom:1px solid #ddd;\"><b>{virtual_start_time} - {virtual_end_time}</b> <span style=\"color:#888; font-size:11px;\">({virtual_tz})</span></td></tr>"
+        
+        tz_breakdown += "</table>"
+        
+        # Static body rendered once per recipient timezone, personalized by substitution
+        bodies_by_tz = {}
+
         # Send personalized email to each attendee
         for recipient in all_recipients:
             # Get recipient's timezone
             recipient_tz = recipient.tz if recipient.tz else 'UTC'
-            recipient_start = self._convert_utc_to_tz(record.start_date, recipient_tz)
-            recipient_end = self._convert_utc_to_tz(record.end_date, recipient_tz)
-            recipient_start_date = recipient_start.strftime('%b %d, %Y')
-            recipient_start_time = recipient_start.strftime('%H:%M')
-            recipient_end_time = recipient_end.strftime('%H:%M')
-            
-            # UTC times (absolute reference)
-            utc_tz = pytz.utc
-            utc_start = pytz.utc.localize(record.start_date) if record.start_date.tzinfo is None else record.start_date.astimezone(utc_tz)
-            utc_end = pytz.utc.localize(record.end_date) if record.end_date.tzinfo is None else record.end_date.astimezone(utc_tz)
-            utc_start_str = utc_start.strftime('%Y-%m-%d %H:%M:%S')
-            utc_end_str = utc_end.strftime('%Y-%m-%d %H:%M:%S')
-            
-            # Build timezone breakdown table
-            tz_breakdown = "<table style=\"width:100%; font-size:13px; color:#444; border:1px solid #ddd; background-color:#f9f9f9; margin-top:15px;\">"
-            tz_breakdown += "<tr style=\"background-color:#e8e8e8;\"><th style=\"padding:8px; text-align:left;\">Location</th><th style=\"padding:8px; text-align:left;\">Local Time</th></tr>"
-            
-            # Add room locations
-            if record.room_location:
-                room_tz = record.room_location.tz if hasattr(record.room_location, 'tz') and record.room_location.tz else host_tz_name
-                room_start = self._convert_utc_to_tz(record.start_date, room_tz)
-                room_end = self._convert_utc_to_tz(record.end_date, room_tz)
-                room_start_time = room_start.strftime('%H:%M')
-                room_end_time = room_end.strftime('%H:%M')
-                tz_breakdown += f"<tr><td style=\"padding:8px; border-bottom:1px solid #ddd;\">🏢 {record.room_location.name}</td><td style=\"padding:8px; border-bottom:1px solid #ddd;\"><b>{room_start_time} - {room_end_time}</b> <span style=\"color:#888; font-size:11px;\">({room_tz})</span></td></tr>"
-            
-            # Add virtual room if exists
-            event = getattr(record, 'meeting_event_id', False)
-            if event and (event.zoom_link or event.virtual_room_id):
-                virtual_tz = event.host_user_id.tz if event.host_user_id and event.host_user_id.tz else host_tz_name
-                virtual_start = self._convert_utc_to_tz(record.start_date, virtual_tz)
-                virtual_end = self._convert_utc_to_tz(record.end_date, virtual_tz)
-                virtual_start_time = virtual_start.strftime('%H:%M')
-                virtual_end_time = virtual_end.strftime('%H:%M')
-                provider_name = "Virtual Room"
-                if event.virtual_room_id:
-                    provider_name = event.virtual_room_id.provider.replace('_', ' ').title() if event.virtual_room_id.provider else "Virtual Room"
-                tz_breakdown += f"<tr><td style=\"padding:8px; border-bottom:1px solid #ddd;\">🎥 {provider_name} (Host)</td><td style=\"padding:8px; border-bottom:1px solid #ddd;\"><b>{virtual_start_time} - {virtual_end_time}</b> <span style=\"color:#888; font-size:11px;\">({virtual_tz})</span></td></tr>"
-            
-            tz_breakdown += "</table>"
-            
-            # Build email body with personalized greeting
-            email_body = f"""
-            <div style="font-family: Arial, sans-serif; color: #333;">
-                <p>Hi <b>{recipient.name}</b>,<br/><br/>
-                I hope this message finds you well. <b>{record.create_uid.name}</b> has invited you to the <b>"{record.name}"</b> meeting.</p>
-                
-                <h3 style="color: #2c3e50; margin-top: 20px; margin-bottom: 10px;">Schedule Details (in your timezone <b>{recipient_tz}</b>):</h3>
-                <table border="0" style="margin-bottom: 15px;">
-                    <tbody>
-                        <tr>
-                            <td style="width:100px; font-weight: bold;">Date</td>
-                            <td>: {recipient_start_date}</td>
-                        </tr>
-                        <tr>
-                            <td style="font-weight: bold;">Time</td>
-                            <td>: {recipient_start_time} - {recipient_end_time} ({recipient_tz})</td>
-                        </tr>
-                        <tr>
-                            <td style="font-weight: bold;">Time (UTC)</td>
-                            <td>: {utc_start_str} - {utc_end_str}</td>
-                        </tr>
-                        <tr>
-                            <td style="font-weight: bold;">Duration</td>
-                            <td>: {meeting_hours_str}{meeting_minutes_str}</td>
-                        </tr>
-                        <tr>
-                            <td style="font-weight: bold;">Location</td>
-                            <td>: {record.room_location.name if record.room_location else 'Virtual Meeting'}</td>
-                        </tr>
-                        {f'<tr><td style="font-weight: bold;"></td><td>(Virtual Room: {event.virtual_room_id.name})</td></tr>' if event and event.virtual_room_id else ''}
-                    </tbody>
-                </table>
-                
-                <h3 style="color: #2c3e50; margin-top: 20px; margin-bottom: 10px;">Timezone Breakdown:</h3>
-                {tz_breakdown}
-                
-                <p style="margin-top: 20px; color: #666;">
-                To accept or decline this invitation, please use the calendar file attachment below.<br/><br/>
-                Best regards,<br/>
-                Meeting Rooms System
-                </p>
-            </div>
-            """
-            
+            if recipient_tz not in bodies_by_tz:
+                recipient_start = self._convert_utc_to_tz(record.start_date, recipient_tz)
+                recipient_end = self._convert_utc_to_tz(record.end_date, recipient_tz)
+                bodies_by_tz[recipient_tz] = render_static(request.env, 'meeting_rooms.legacy_invitation_email_body', {
+                    'organizer_name': record.create_uid.name,
+                    'subject': record.name,
+                    'tz_name': recipient_tz,
+                    'formatted_date': recipient_start.strftime('%b %d, %Y'),
+                    'start_str': recipient_start.strftime('%H:%M'),
+                    'end_str': recipient_end.strftime('%H:%M'),
+                    'utc_start': utc_start_str,
+                    'utc_end': utc_end_str,
+                    'duration_str': meeting_hours_str + meeting_minutes_str,
+                    'loc_name': record.room_location.name if record.room_location else 'Virtual Meeting',
+                    'virtual_room_name': event.virtual_room_id.name if event and event.virtual_room_id else False,
+                    'tz_breakdown': tz_breakdown,
+                })
+            email_body = personalize(bodies_by_tz[recipient_tz], recipient.name)
+
             email = request.env['mail.mail'].sudo().create({
                 'subject': record.subject,
                 'email_from': email_from,
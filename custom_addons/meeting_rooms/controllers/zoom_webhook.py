@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+from odoo import http
+from odoo.http import request, Response
+import json
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# Zoom notifications handled by meeting.event._handle_zoom_webhook
+HANDLED_EVENTS = ('meeting.ended', 'meeting.summary_completed')
+
+
+class ZoomWebhook(http.Controller):
+
+    # =========================================================================
+    # Zoom event subscription (meeting.ended / meeting.summary_completed)
+    # =========================================================================
+    @http.route('/meeting/zoom/webhook', type='json', auth='public', methods=['POST'], csrf=False)
+    def zoom_webhook(self, **kw):
+        """
+        Receive Zoom notifications, verified with the subscription secret token.
+
+        Zoom posts application/json, which Odoo dispatches as a JSON request:
+        the answer is sent as a bare JSON document (see _reply) because Zoom
+        does not understand the JSON-RPC envelope.
+        """
+        httprequest = request.httprequest
+        body = httprequest.get_data(as_text=True)
+        match = request.env['virtual.room'].sudo()._match_zoom_webhook(
+            body,
+            httprequest.headers.get('x-zm-request-timestamp'),
+            httprequest.headers.get('x-zm-signature'),
+        )
+        if not match:
+            return self._reply({'status': 'unauthorized'}, status=401)
+        room, secret = match
+
+        data = request.jsonrequest or {}
+        event = data.get('event')
+        payload = data.get('payload') or {}
+
+        # Endpoint validation: prove we own the secret token
+        if event == 'endpoint.url_validation':
+            plain_token = payload.get('plainToken') or ''
+            return self._reply({
+                'plainToken': plain_token,
+                'encryptedToken': request.env['virtual.room']._zoom_webhook_sign(secret, plain_token),
+            })
+
+        if event in HANDLED_EVENTS:
+            request.env['meeting.event'].sudo()._handle_zoom_webhook(event, payload, room=room)
+        else:
+            _logger.info("Zoom webhook: ignored event %s", event)
+        return self._reply({'status': 'ok'})
+
+    def _reply(self, data, status=200):
+        response = Response(json.dumps(data), status=status, content_type='application/json')
+        # JSON requests are wrapped in a JSON-RPC envelope by _json_response: answer as is
+        request._json_response = lambda result=None, error=None: response
+        return data
@@ -1,5 +1,10 @@
+from . import booking_exclusion
 from . import model
 from . import meeting_event
+from . import recurrence_exception
 from . import meeting_rooms_ext
 from . import virtual_room
-from . import booking_link
\ No newline at end of file
+from . import booking_link
+from . import busy_projection
+from . import virtual_job
+from . import calendar_feed
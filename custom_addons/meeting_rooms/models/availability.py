@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+"""
+Availability Engine - free/busy arithmetic for booking pages.
+
+Busy meetings are merged into a sorted list of disjoint intervals once.
+Candidate slots are then checked with a bisect lookup (random access) or a
+single forward sweep (ordered generation), so producing N slots against M
+meetings costs O(N + M log M) instead of the old O(N * M) nested loop.
+
+All datetimes handled here are naive UTC, exactly like Odoo stores them.
+"""
+from bisect import bisect_left
+from datetime import datetime, time, timedelta
+import hashlib
+import pytz
+
+# Default template used when a caller does not provide working hours:
+# every weekday (0=Monday ... 6=Sunday) from 09:00 to 17:00, in minutes.
+DEFAULT_WORKING_HOURS = {weekday: ((9 * 60, 17 * 60),) for weekday in range(7)}
+
+
+def merge_intervals(intervals):
+    """
+    Sort and merge overlapping or touching (start, end) intervals.
+
+    Args:
+        intervals: Iterable of (start, end) tuples. Empty/negative intervals are dropped.
+
+    Returns:
+        List of disjoint (start, end) tuples sorted by start
+    """
+    merged = []
+    for start, end in sorted(i for i in intervals if i[0] and i[1] and i[0] < i[1]):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+class BusyIndex(object):
+    """
+    Read-only lookup structure over merged busy intervals.
+
+    Because merged intervals are disjoint, both their starts and their ends
+    are sorted, which makes a single bisect enough to answer overlap queries.
+    """
+
+    __slots__ = ('intervals', '_starts')
+
+    def __init__(self, intervals=(), padding=None):
+        if padding:
+            # Buffer time: a meeting also blocks `padding` before and after it
+            intervals = ((start - padding, end + padding) for start, end in intervals)
+        self.intervals = merge_intervals(intervals)
+        self._starts = [start for start, _end in self.intervals]
+
+    def __len__(self):
+        return len(self.intervals)
+
+    def __bool__(self):
+        return bool(self.intervals)
+
+    def overlaps(self, start, end):
+        """
+        Check whether [start, end) intersects any busy interval.
+
+        Only the last interval starting before `end` can overlap without an
+        earlier one overlapping too, so one bisect is sufficient.
+        """
+        pos = bisect_left(self._starts, end) - 1
+        return pos >= 0 and self.intervals[pos][1] > start
+
+    def is_free(self, start, end):
+        return not self.overlaps(start, end)
+
+
+class ScheduleTemplate(object):
+    """
+    Compact, precomputed weekly slot grid of a booking link.
+
+    Slot offsets (from local midnight) are computed once per weekday, so
+    rendering a long horizon is only additions on the hot path: a day
+    without a DST change needs a single localize() call, not one per slot.
+    """
+
+    __slots__ = ('slot_minutes', 'buffer_minutes', 'horizon_days', 'offsets', 'fingerprint', '_minutes')
+
+    def __init__(self, working_hours=None, slot_minutes=60, buffer_minutes=0, horizon_days=6):
+        if working_hours is None:
+            working_hours = DEFAULT_WORKING_HOURS
+        self.slot_minutes = slot_minutes
+        self.buffer_minutes = buffer_minutes
+        self.horizon_days = horizon_days
+
+        minutes = []
+        for weekday in range(7):
+            day_minutes = set()
+            for win_start, win_end in working_hours.get(weekday, ()):
+                minute = win_start
+                while minute + slot_minutes <= win_end:
+                    day_minutes.add(minute)
+                    minute += slot_minutes
+            minutes.append(tuple(sorted(day_minutes)))
+        self._minutes = tuple(minutes)
+        self.offsets = tuple(tuple(timedelta(minutes=m) for m in day) for day in minutes)
+        # Stable across workers (no str hashing involved), used in HTTP validators
+        self.fingerprint = hashlib.sha1(
+            repr((slot_minutes, buffer_minutes, horizon_days, self._minutes)).encode()
+        ).hexdigest()[:16]
+
+    @property
+    def slot_delta(self):
+        return timedelta(minutes=self.slot_minutes)
+
+    @property
+    def buffer_delta(self):
+        return timedelta(minutes=self.buffer_minutes)
+
+    def is_slot_start(self, local_naive):
+        """Check whether a local naive datetime is a slot start of this grid."""
+        minute = local_naive.hour * 60 + local_naive.minute
+        return not local_naive.second and minute in self._minutes[local_naive.weekday()]
+
+    def count_passed(self, local_naive):
+        """Number of slots of that local day already started at local_naive."""
+        minute = local_naive.hour * 60 + local_naive.minute
+        return sum(1 for m in self._minutes[local_naive.weekday()] if m < minute or (m == minute and local_naive.second))
+
+    def iter_day(self, local_date, tz):
+        """
+        Yield (local_naive, utc_start, utc_end) for every slot of one local day.
+
+        Args:
+            local_date: date in the booking timezone
+            tz: pytz timezone object
+        """
+        offsets = self.offsets[local_date.weekday()]
+        if not offsets:
+            return
+        slot_delta = self.slot_delta
+        midnight = datetime.combine(local_date, time(0, 0))
+        utc_offset = tz.localize(midnight).utcoffset()
+        if utc_offset == tz.localize(midnight + timedelta(days=1)).utcoffset():
+            # Fast path: constant offset for the whole day
+            base_utc = midnight - utc_offset
+            for offset in offsets:
+                slot_utc = base_utc + offset
+                yield midnight + offset, slot_utc, slot_utc + slot_delta
+        else:
+            # DST transition day: localize each slot individually
+            for offset in offsets:
+                slot_naive = midnight + offset
+                slot_local = tz.normalize(tz.localize(slot_naive))
+                if slot_local.replace(tzinfo=None) != slot_naive:
+                    continue  # local time skipped by the DST jump
+                yield slot_naive, slot_local.astimezone(pytz.utc).replace(tzinfo=None), \
+                    slot_local.astimezone(pytz.utc).replace(tzinfo=None) + slot_delta
+
+
+DEFAULT_TEMPLATE = ScheduleTemplate()
+
+
+def free_slots(busy, tz, window_start, window_end, template=None):
+    """
+    Compute free slots per local day in near-linear time.
+
+    Slots are generated in chronological order, so the busy intervals are
+    consumed with a single forward pointer instead of being rescanned.
+
+    Args:
+        busy: BusyIndex (or iterable of (start, end) naive UTC tuples)
+        tz: pytz timezone object of the booking page
+        window_start: naive UTC datetime, slots starting earlier are skipped
+        window_end: naive UTC datetime, slots ending later are skipped
+        template: ScheduleTemplate (defaults to 1-hour slots, 09:00-17:00 every day)
+
+    Returns:
+        List of (local_date, [(local_naive, utc_start, utc_end), ...]) for days with free slots
+    """
+    if template is None:
+        template = DEFAULT_TEMPLATE
+    if not isinstance(busy, BusyIndex):
+        busy = BusyIndex(busy, padding=template.buffer_delta)
+
+    intervals = busy.intervals
+    pointer = 0
+    result = []
+
+    first_day = pytz.utc.localize(window_start).astimezone(tz).date()
+    last_day = pytz.utc.localize(window_end).astimezone(tz).date()
+    day = first_day
+    while day <= last_day:
+        day_slots = []
+        for slot_naive, slot_start, slot_end in template.iter_day(day, tz):
+            if slot_start < window_start or slot_end > window_end:
+                continue
+            # Drop busy intervals that end before this slot; they can't affect later slots
+            while pointer < len(intervals) and intervals[pointer][1] <= slot_start:
+                pointer += 1
+            if pointer < len(intervals) and intervals[pointer][0] < slot_end:
+                continue
+            day_slots.append((slot_naive, slot_start, slot_end))
+        if day_slots:
+            result.append((day, day_slots))
+        day += timedelta(days=1)
+    return result
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+from odoo import models, api, _
+from odoo.exceptions import ValidationError
+from odoo.tools import sql, str2bool
+from contextlib import contextmanager
+import logging
+import re
+
+import psycopg2
+from psycopg2 import errorcodes
+
+_logger = logging.getLogger(__name__)
+
+# System parameter switching the database-level overlap protection on.
+# Applied by init(), i.e. on module install/update.
+EXCLUSION_PARAM = 'meeting_rooms.use_exclusion_constraints'
+
+# Generated column holding the booked [start, end) range
+RANGE_COLUMN = 'booking_range'
+
+# NULL (never conflicting) when a date is missing, empty when dates are inverted:
+# those rows are left to the Python constraints and their own error messages.
+RANGE_EXPRESSION = (
+    "CASE WHEN start_date IS NOT NULL AND end_date IS NOT NULL "
+    "THEN tsrange(start_date, GREATEST(start_date, end_date), '[)') END"
+)
+
+# ... conflicts with existing key (room_location, booking_range)=(3, ["2024-01-01 09:00:00","2024-01-01 10:00:00")).
+_EXISTING_KEY_RE = re.compile(r'existing key \([^)]*\)=\((\d+), [\[(]"?([^",]+)"?,"?([^",\])]+)"?[\])]\)')
+
+
+class MeetingBookingExclusionMixin(models.AbstractModel):
+    """
+    Opt-in PostgreSQL exclusion constraint against overlapping bookings.
+
+    The Python constraints search for overlaps after the write, so two
+    concurrent transactions can both pass them. When the system parameter
+    `meeting_rooms.use_exclusion_constraints` is enabled, init() installs
+    a GiST exclusion constraint (btree_gist) on
+    (<resource column> WITH =, booking_range WITH &&) for confirmed rows,
+    and the database rejects the second booking atomically.
+
+    Violations are translated into the usual ValidationError messages.
+    """
+    _name = 'meeting.booking.exclusion.mixin'
+    _description = 'Booking Overlap Exclusion Constraint'
+
+    # Column of the booked resource (set by inheriting models)
+    _exclusion_resource = None
+    # Rows taking part in the constraint
+    _exclusion_where = "state = 'confirm'"
+
+    # ==========================================================
+    # SCHEMA
+    # ==========================================================
+    def init(self):
+        super(MeetingBookingExclusionMixin, self).init()
+        if self._abstract or not self._exclusion_resource:
+            return
+        self._sync_exclusion_constraint()
+
+    def _exclusion_constraint_name(self):
+        return '%s_%s_no_overlap' % (self._table, self._exclusion_resource)
+
+    @api.model
+    def _exclusion_enabled(self):
+        return str2bool(self.env['ir.config_parameter'].sudo().get_param(EXCLUSION_PARAM) or 'False')
+
+    @api.model
+    def _sync_exclusion_constraint(self):
+        """
+        Install or drop the exclusion constraint according to the system parameter.
+
+        Installation failures (existing overlapping rows, btree_gist not
+        available to the database user) are logged and leave the module
+        working with the Python constraints only.
+        """
+        cr = self.env.cr
+        table = self._table
+        name = self._exclusion_constraint_name()
+
+        if not self._exclusion_enabled():
+            if sql.column_exists(cr, table, RANGE_COLUMN):
+                cr.execute('ALTER TABLE "{}" DROP CONSTRAINT IF EXISTS "{}"'.format(table, name))
+                cr.execute('ALTER TABLE "{}" DROP COLUMN "{}"'.format(table, RANGE_COLUMN))
+                _logger.info("Table %r: overlap exclusion constraint %r removed", table, name)
+            return
+
+        try:
+            with cr.savepoint():
+                cr.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+                if not sql.column_exists(cr, table, RANGE_COLUMN):
+                    cr.execute('ALTER TABLE "{}" ADD COLUMN "{}" tsrange GENERATED ALWAYS AS ({}) STORED'.format(
+                        table, RANGE_COLUMN, RANGE_EXPRESSION))
+                if not sql.constraint_definition(cr, table, name):
+                    cr.execute('ALTER TABLE "{}" ADD CONSTRAINT "{}" EXCLUDE USING gist ("{}" WITH =, "{}" WITH &&) WHERE ({})'.format(
+                        table, name, self._exclusion_resource, RANGE_COLUMN, self._exclusion_where))
+                    _logger.info("Table %r: overlap exclusion constraint %r installed", table, name)
+        except psycopg2.Error as e:
+            _logger.warning("Table %r: unable to install overlap exclusion constraint %r: %s", table, name, e)
+
+    # ==========================================================
+    # WRITE PATH
+    # ==========================================================
+    @api.model
+    def _create(self, data_list):
+        if not self._exclusion_resource or not self._exclusion_enabled():
+            return super(MeetingBookingExclusionMixin, self)._create(data_list)
+        with self._translate_exclusion_violation():
+            return super(MeetingBookingExclusionMixin, self)._create(data_list)
+
+    def _write(self, vals):
+        trigger = {'start_date', 'end_date', 'state', self._exclusion_resource}
+        if not self._exclusion_resource or not trigger.intersection(vals) or not self._exclusion_enabled():
+            return super(MeetingBookingExclusionMixin, self)._write(vals)
+        with self._translate_exclusion_violation():
+            return super(MeetingBookingExclusionMixin, self)._write(vals)
+
+    @contextmanager
+    def _translate_exclusion_violation(self):
+        """Run the SQL in a savepoint and raise violations as ValidationError."""
+        try:
+            with self.env.cr.savepoint():
+                yield
+        except psycopg2.IntegrityError as e:
+            if e.pgcode != errorcodes.EXCLUSION_VIOLATION or e.diag.constraint_name != self._exclusion_constraint_name():
+                raise
+            raise ValidationError(self._exclusion_conflict_message(self._find_exclusion_conflict(e.diag.message_detail)))
+
+    @api.model
+    def _find_exclusion_conflict(self, detail):
+        """
+        Find the already booked row reported by PostgreSQL.
+
+        Args:
+            detail: DETAIL line of the exclusion violation
+
+        Returns:
+            Conflicting record (sudo), or an empty recordset if it can't be identified
+        """
+        match = _EXISTING_KEY_RE.search(detail or '')
+        if not match:
+            return self.sudo().browse()
+        resource_id, range_start, range_end = match.groups()
+        self.env.cr.execute(
+            'SELECT id FROM "{}" WHERE "{}" = %s AND "{}" && tsrange(%s, %s, \'[)\') AND {} LIMIT 1'.format(
+                self._table, self._exclusion_resource, RANGE_COLUMN, self._exclusion_where),
+            (int(resource_id), range_start, range_end))
+        row = self.env.cr.fetchone()
+        return self.sudo().browse(row[0] if row else [])
+
+    def _exclusion_conflict_message(self, conflict):
+        """
+        Build the error message for a conflicting booking (override in models).
+
+        Args:
+            conflict: Already booked record, possibly empty
+        """
+        return _("This resource is already booked for the selected time.")
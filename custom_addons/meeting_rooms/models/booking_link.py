@@ -1,10 +1,12 @@
 # -*- coding: utf-8 -*-
-from odoo import models, fields, api, _
-from odoo.exceptions import UserError
+from odoo import models, fields, api, tools, _
+from odoo.exceptions import UserError, ValidationError
 import uuid
 import pytz
 from werkzeug.urls import url_join
 
+from .availability import ScheduleTemplate, DEFAULT_WORKING_HOURS
+
 # Timezone helper
 _tzs = [(tz, tz) for tz in sorted(pytz.all_timezones, key=lambda tz: tz if not tz.startswith('Etc/') else '_')]
 def _tz_get(self):
@@ -50,15 +52,85 @@ class MeetingBookingLink(models.Model):
                           default=lambda self: self.env.user.tz or 'UTC',
                           help="Timezone displayed in booking portal for external guests")
 
+    # === SCHEDULING CONFIGURATION ===
+    slot_duration = fields.Integer(
+        string="Slot Duration (Minutes)", default=60, required=True,
+        help="Length of one bookable meeting slot"
+    )
+    buffer_time = fields.Integer(
+        string="Buffer Time (Minutes)", default=0,
+        help="Free time kept before and after every existing meeting of the host"
+    )
+    horizon_days = fields.Integer(
+        string="Booking Horizon (Days)", default=6, required=True,
+        help="How many days ahead guests can book"
+    )
+    window_ids = fields.One2many(
+        'meeting.booking.link.window', 'link_id', string="Working Hours",
+        help="Bookable windows per weekday. Leave empty for 09:00 - 17:00 every day."
+    )
+
     # Helper fields for display and permissions
     is_current_user = fields.Boolean(compute='_compute_permissions')
     is_admin = fields.Boolean(compute='_compute_permissions')
 
     # === DATABASE GUARANTEE: PREVENT DUPLICATE TOKENS ===
     _sql_constraints = [
-        ('token_unique', 'UNIQUE(token)', 'Booking Link token must be unique! System detected duplicate token.')
+        ('token_unique', 'UNIQUE(token)', 'Booking Link token must be unique! System detected duplicate token.'),
+        ('slot_duration_positive', 'CHECK(slot_duration > 0)', 'Slot duration must be positive.'),
+        ('buffer_time_positive', 'CHECK(buffer_time >= 0)', 'Buffer time cannot be negative.'),
+        ('horizon_days_range', 'CHECK(horizon_days > 0 AND horizon_days <= 365)', 'Booking horizon must be between 1 and 365 days.'),
     ]
 
+    # ========================================================
+    # SCHEDULE TEMPLATE (PRECOMPUTED, CACHED PER LINK)
+    # ========================================================
+    @api.model_create_multi
+    def create(self, vals_list):
+        res = super(MeetingBookingLink, self).create(vals_list)
+        self.clear_caches()
+        return res
+
+    def write(self, vals):
+        res = super(MeetingBookingLink, self).write(vals)
+        self.clear_caches()
+        return res
+
+    def unlink(self):
+        res = super(MeetingBookingLink, self).unlink()
+        self.clear_caches()
+        return res
+
+    @api.model
+    @tools.ormcache('link_id')
+    def _get_schedule_template(self, link_id):
+        """
+        Build the weekly slot grid of a link once and keep it in the registry cache.
+
+        Invalidated by create/write/unlink on links and working windows.
+
+        Returns:
+            availability.ScheduleTemplate (immutable, safe to share between requests)
+        """
+        link = self.sudo().browse(link_id)
+        working_hours = DEFAULT_WORKING_HOURS
+        if link.window_ids:
+            working_hours = {}
+            for window in link.window_ids.sorted(lambda w: (w.weekday, w.hour_from)):
+                working_hours.setdefault(int(window.weekday), []).append(
+                    (int(round(window.hour_from * 60)), int(round(window.hour_to * 60)))
+                )
+        return ScheduleTemplate(
+            working_hours=working_hours,
+            slot_minutes=link.slot_duration or 60,
+            buffer_minutes=link.buffer_time or 0,
+            horizon_days=link.horizon_days or 6,
+        )
+
+    def get_schedule_template(self):
+        self.ensure_one()
+        return self._get_schedule_template(self.id)
+
     @api.depends('user_id')
     def _compute_permissions(self):
         # REVISED: Check Meeting Manager Group, NOT System Administrator
@@ -141,4 +213,45 @@ class MeetingBookingLink(models.Model):
                 DROP CONSTRAINT IF EXISTS meeting_booking_link_user_id_uniq;
             """)
         except Exception:
-            pass
\ No newline at end of file
+            pass
+
+
+class MeetingBookingLinkWindow(models.Model):
+    _name = 'meeting.booking.link.window'
+    _description = 'Booking Link Working Window'
+    _order = 'weekday, hour_from'
+
+    link_id = fields.Many2one('meeting.booking.link', string="Booking Link", required=True, ondelete='cascade', index=True)
+    weekday = fields.Selection([
+        ('0', 'Monday'),
+        ('1', 'Tuesday'),
+        ('2', 'Wednesday'),
+        ('3', 'Thursday'),
+        ('4', 'Friday'),
+        ('5', 'Saturday'),
+        ('6', 'Sunday'),
+    ], string="Day of Week", required=True, default='0')
+    hour_from = fields.Float(string="From", required=True, default=9.0)
+    hour_to = fields.Float(string="To", required=True, default=17.0)
+
+    @api.constrains('hour_from', 'hour_to')
+    def _check_hours(self):
+        for rec in self:
+            if not (0 <= rec.hour_from < rec.hour_to <= 24):
+                raise ValidationError(_("Working window must be within 00:00 - 24:00 and end after it starts."))
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        res = super(MeetingBookingLinkWindow, self).create(vals_list)
+        self.clear_caches()
+        return res
+
+    def write(self, vals):
+        res = super(MeetingBookingLinkWindow, self).write(vals)
+        self.clear_caches()
+        return res
+
+    def unlink(self):
+        res = super(MeetingBookingLinkWindow, self).unlink()
+        self.clear_caches()
+        return res
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+from odoo import models, fields, api, _
+from odoo.tools.lru import LRU
+from datetime import datetime, timedelta
+import json
+import logging
+
+_logger = logging.getLogger(__name__)
+
+# Process-local cache (LRU is thread-safe): (dbname, user_id) -> (version, window_start, window_end, intervals)
+# The shared table below is the fallback between workers and the source of truth for versions.
+_PROJECTION_CACHE = LRU(1024)
+
+# Default span computed ahead whenever a projection is rebuilt
+PROJECTION_PAST = timedelta(days=1)
+PROJECTION_AHEAD = timedelta(days=62)
+
+
+class MeetingBusyProjection(models.Model):
+    """
+    Cached free/busy projection of one host (confirmed meetings only).
+
+    Booking pages read busy intervals from here instead of searching
+    meeting.event through the attendee many2many on every hit:
+    1. A single-row version lookup (raw SQL) validates the process-local cache.
+    2. On a miss, the serialized intervals stored in this table are reused.
+    3. Only for a window the stored span does not cover is meeting.event
+       queried again, and that result stays in the process-local cache:
+       the public read path never writes to the database.
+
+    meeting.event create/write/unlink rebuild the stored projection of the
+    affected hosts only, bumping their version (incremental invalidation).
+    """
+    _name = 'meeting.busy.projection'
+    _description = 'Host Free/Busy Projection'
+    _log_access = False
+
+    user_id = fields.Many2one('res.users', string="Host User", required=True, ondelete='cascade', index=True)
+    version = fields.Integer("Version", default=1, required=True)
+    window_start = fields.Datetime("Window Start")
+    window_end = fields.Datetime("Window End")
+    busy_data = fields.Text("Busy Intervals (JSON)")
+
+    _sql_constraints = [
+        ('user_uniq', 'UNIQUE(user_id)', 'Only one free/busy projection per user is allowed.'),
+    ]
+
+    # ==========================================================
+    # READ PATH
+    # ==========================================================
+    @api.model
+    def _get_projection(self, user_id, window_start, window_end):
+        """
+        Return busy intervals of a host covering [window_start, window_end].
+
+        Args:
+            user_id: res.users id
+            window_start: naive UTC datetime
+            window_end: naive UTC datetime
+
+        Returns:
+            Tuple (version, intervals) where intervals is a tuple of (start, end) naive UTC tuples
+        """
+        cr = self.env.cr
+        key = (cr.dbname, user_id)
+
+        cr.execute("""
+            SELECT version, window_start, window_end, busy_data IS NOT NULL
+              FROM meeting_busy_projection
+             WHERE user_id = %s
+        """, (user_id,))
+        row = cr.fetchone()
+        version = row[0] if row else 1
+
+        cached = _PROJECTION_CACHE.get(key)
+        if cached and cached[0] == version and cached[1] <= window_start and cached[2] >= window_end:
+            return version, cached[3]
+
+        if row:
+            _version, row_start, row_end, has_data = row
+            if has_data and row_start <= window_start and row_end >= window_end:
+                # Rebuilt by the last meeting change: reuse the shared copy
+                cr.execute("SELECT busy_data FROM meeting_busy_projection WHERE user_id = %s AND version = %s", (user_id, version))
+                data = cr.fetchone()
+                if data and data[0]:
+                    intervals = tuple(
+                        (fields.Datetime.to_datetime(start), fields.Datetime.to_datetime(end))
+                        for start, end in json.loads(data[0])
+                    )
+                    self._remember(key, version, row_start, row_end, intervals)
+                    return version, intervals
+
+        # Window outside the stored span (or host never changed): rebuild for this process only
+        now = datetime.utcnow()
+        build_start = min(window_start, now - PROJECTION_PAST)
+        build_end = max(window_end, now + PROJECTION_AHEAD)
+        intervals = self._build_intervals([user_id], build_start, build_end)[user_id]
+        self._remember(key, version, build_start, build_end, intervals)
+        return version, intervals
+
+    @api.model
+    def _build_intervals(self, user_ids, window_start, window_end):
+        """
+        Busy intervals of several hosts from meeting.event, with one search.
+
+        Recurrent meetings are expanded lazily over the window only.
+
+        Returns:
+            Dict user_id -> sorted tuple of (start, end) naive UTC tuples
+        """
+        Event = self.env['meeting.event'].sudo()
+        events = Event.search(Event._occurrence_domain(window_start, window_end) + [
+            ('state', '=', 'confirm'),
+            ('attendee', 'in', list(user_ids)),
+        ])
+        wanted = set(user_ids)
+        by_user = {uid: [] for uid in user_ids}
+        for event, _rid, start, end in events._iter_occurrences(window_start, window_end):
+            for uid in wanted.intersection(event.attendee.ids):
+                by_user[uid].append((start, end))
+        return {uid: tuple(sorted(intervals)) for uid, intervals in by_user.items()}
+
+    @api.model
+    def _get_version(self, user_id):
+        """
+        Current projection version of a host, without building anything.
+
+        Single-row lookup returning the same version _get_projection() would
+        report, so it can validate an HTTP cache before any interval is read.
+        """
+        self.env.cr.execute("SELECT version FROM meeting_busy_projection WHERE user_id = %s", (user_id,))
+        row = self.env.cr.fetchone()
+        return row[0] if row else 1
+
+    @api.model
+    def _remember(self, key, version, window_start, window_end, intervals):
+        _PROJECTION_CACHE[key] = (version, window_start, window_end, intervals)
+
+    # ==========================================================
+    # INVALIDATION
+    # ==========================================================
+    @api.model
+    def _invalidate_users(self, user_ids):
+        """
+        Rebuild the stored projection of the given hosts and bump their version.
+
+        Runs on the write path (meeting changes), after the change, with one
+        meeting.event search for all hosts. Other workers notice the new
+        version on their next lookup and drop their process-local copy;
+        untouched hosts keep their cache.
+        """
+        user_ids = sorted(set(uid for uid in user_ids if uid))
+        if not user_ids:
+            return
+        now = datetime.utcnow()
+        build_start, build_end = now - PROJECTION_PAST, now + PROJECTION_AHEAD
+        by_user = self._build_intervals(user_ids, build_start, build_end)
+        payloads = [json.dumps([
+            (fields.Datetime.to_string(start), fields.Datetime.to_string(end)) for start, end in by_user[uid]
+        ]) for uid in user_ids]
+        # A host without a row reports version 1, so a new row starts at 2
+        self.env.cr.execute("""
+            INSERT INTO meeting_busy_projection (user_id, version, window_start, window_end, busy_data)
+            SELECT uid, 2, %s, %s, data FROM unnest(%s::int[], %s::text[]) AS projection(uid, data)
+            ON CONFLICT (user_id) DO UPDATE
+               SET version = meeting_busy_projection.version + 1,
+                   window_start = EXCLUDED.window_start,
+                   window_end = EXCLUDED.window_end,
+                   busy_data = EXCLUDED.busy_data
+        """, (build_start, build_end, user_ids, payloads))
+        dbname = self.env.cr.dbname
+        for uid in user_ids:
+            try:
+                del _PROJECTION_CACHE[(dbname, uid)]
+            except KeyError:
+                pass
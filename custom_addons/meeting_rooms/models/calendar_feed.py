@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+from odoo import models, fields, api, _
+from datetime import datetime, timedelta
+from werkzeug.urls import url_join
+import hashlib
+import uuid
+
+from .ics_builder import ICSCalendar, make_uid
+
+# Rolling window published by the feeds, relative to today
+FEED_PAST_DAYS = 30
+FEED_FUTURE_DAYS = 180
+
+
+def _new_feed_token():
+    return uuid.uuid4().hex
+
+
+class ResUsers(models.Model):
+    _inherit = 'res.users'
+
+    meeting_feed_token = fields.Char("Calendar Feed Token", copy=False, groups='base.group_system')
+    meeting_feed_url = fields.Char("Calendar Feed URL", compute='_compute_meeting_feed_url')
+
+    def _compute_meeting_feed_url(self):
+        base_url = self.env['ir.config_parameter'].sudo().get_param('web.base.url')
+        for user in self:
+            token = user.sudo().meeting_feed_token
+            user.meeting_feed_url = url_join(base_url, '/meeting/feed/user/%s.ics' % token) if token else False
+
+    def action_regenerate_meeting_feed_token(self):
+        """Issue a new feed token; subscriptions using the old URL stop working."""
+        for user in self:
+            user.sudo().meeting_feed_token = _new_feed_token()
+
+
+class RoomLocation(models.Model):
+    _inherit = 'room.location'
+
+    feed_token = fields.Char("Calendar Feed Token", copy=False, groups='base.group_system')
+    feed_url = fields.Char("Calendar Feed URL", compute='_compute_feed_url')
+
+    def _compute_feed_url(self):
+        base_url = self.env['ir.config_parameter'].sudo().get_param('web.base.url')
+        for room in self:
+            token = room.sudo().feed_token
+            room.feed_url = url_join(base_url, '/meeting/feed/room/%s.ics?token=%s' % (room.id, token)) if token else False
+
+    def action_regenerate_feed_token(self):
+        """Issue a new feed token; subscriptions using the old URL stop working."""
+        for room in self:
+            room.sudo().feed_token = _new_feed_token()
+
+
+class MeetingCalendarFeed(models.AbstractModel):
+    """
+    Subscribable iCalendar feeds of confirmed meetings.
+
+    A feed covers a rolling window around today for one user (meetings
+    they attend or host) or one room location. Both meeting.event and the
+    stand-alone meeting.rooms bookings are published; bookings mirrored
+    from an event only appear once, as the event.
+
+    Calendar clients poll feeds periodically. The validator (ETag and
+    Last-Modified) is computed from the number of meetings in the window
+    and their latest write_date, so an unchanged feed is answered with a
+    304 without loading or serializing any meeting. Changing an occurrence
+    of a series bumps the meeting's version, hence its write_date.
+    """
+    _name = 'meeting.calendar.feed'
+    _description = 'Meeting Calendar Feed'
+
+    @api.model
+    def _feed_window(self):
+        today = datetime.combine(fields.Date.context_today(self), datetime.min.time())
+        return today - timedelta(days=FEED_PAST_DAYS), today + timedelta(days=FEED_FUTURE_DAYS)
+
+    @api.model
+    def _feed_domains(self, user=None, room=None):
+        """
+        Domains of the meetings published by a feed.
+
+        Args:
+            user: res.users record (user feed)
+            room: room.location record (room feed)
+
+        Returns:
+            Dict model name -> domain
+        """
+        window_start, window_end = self._feed_window()
+        common = [
+            ('state', '=', 'confirm'),
+            ('start_date', '<', window_end),
+            ('end_date', '>', window_start),
+        ]
+        # Series are published once (RRULE) when any occurrence falls in the window
+        events_common = [('state', '=', 'confirm')] + self.env['meeting.event']._occurrence_domain(window_start, window_end)
+        if user:
+            event_domain = ['|', ('attendee', 'in', user.ids), ('host_user_id', '=', user.id)]
+            rooms_domain = [('attendee', 'in', user.ids)]
+        else:
+            event_domain = [('room_location_ids', 'in', room.ids)]
+            rooms_domain = [('room_location', '=', room.id)]
+        return {
+            'meeting.event': events_common + event_domain,
+            'meeting.rooms': common + rooms_domain + [('meeting_event_id', '=', False)],
+        }
+
+    @api.model
+    def _feed_validators(self, domains, key):
+        """
+        Cheap change detection: count and latest write_date per model.
+
+        Args:
+            domains: Result of _feed_domains()
+            key: Feed identity, part of the ETag
+
+        Returns:
+            Tuple (etag, last_modified) where last_modified is a naive UTC datetime or None
+        """
+        window_start, _window_end = self._feed_window()
+        parts = [key, window_start.date().isoformat()]
+        last_modified = None
+        for model in sorted(domains):
+            Model = self.env[model].sudo()
+            count = Model.search_count(domains[model])
+            latest = Model.search(domains[model], order='write_date desc', limit=1).write_date if count else None
+            parts.append('%s:%s:%s' % (model, count, latest or ''))
+            if latest and (not last_modified or latest > last_modified):
+                last_modified = latest
+        return hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest(), last_modified
+
+    @api.model
+    def _feed_render(self, domains, tz_name, name):
+        """
+        Serialize the feed.
+
+        Args:
+            domains: Result of _feed_domains()
+            tz_name: Timezone the events are written in
+            name: Calendar display name (X-WR-CALNAME)
+
+        Returns:
+            ICS payload (bytes)
+        """
+        uid_domain = self.env['ir.config_parameter'].sudo().get_param('database.uuid')
+        calendar = ICSCalendar(name=name)
+
+        events = self.env['meeting.event'].sudo().search(domains['meeting.event'], order='start_date')
+        for ev in events:
+            ev._add_ics_events(
+                calendar,
+                tz_name,
+                summary=ev.subject,
+                description=ev.description,
+                location=", ".join(ev.room_location_ids.mapped('name')) if ev.room_location_ids else ev.zoom_link or "Virtual",
+                dtstamp=ev.write_date,
+                last_modified=ev.write_date,
+                sequence=ev.version,
+                status='CONFIRMED',
+                url=ev.zoom_link or None,
+            )
+
+        bookings = self.env['meeting.rooms'].sudo().search(domains['meeting.rooms'], order='start_date')
+        for booking in bookings:
+            calendar.add_event(
+                make_uid('meeting_rooms', booking.id, uid_domain),
+                booking.start_date,
+                booking.end_date,
+                tzid=tz_name,
+                summary=booking.subject,
+                description=booking.description,
+                location=booking.room_location.name,
+                dtstamp=booking.write_date,
+                last_modified=booking.write_date,
+                sequence=booking.version,
+                status='CONFIRMED',
+            )
+        return calendar.to_bytes()
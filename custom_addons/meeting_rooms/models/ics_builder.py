@@ -0,0 +1,329 @@
+# -*- coding: utf-8 -*-
+"""
+ICS Builder - in-memory RFC 5545 calendar serialization.
+
+Events are given in naive UTC (exactly like Odoo stores datetimes) and
+written in the requested timezone, with a VTIMEZONE holding the real
+STANDARD/DAYLIGHT observances taken from the pytz transition table.
+Observances are cached per (tzid, year), so a calendar of N events in the
+same timezone costs one table walk per year, not one per event. Past the
+end of the pytz table (open-ended series), the last DST pair repeats
+yearly through an RRULE.
+
+Text values are escaped, lines are folded at 75 octets and the output
+uses CRLF line endings. Nothing is written to the filesystem.
+"""
+from bisect import bisect_right
+from datetime import datetime, timedelta
+import calendar
+import functools
+import pytz
+
+from . import tz_service
+
+PRODID = '-//Odoo Meeting Rooms//EN'
+
+# Observances older than this are clamped: clients only need the rule in effect
+ICS_EPOCH = datetime(1970, 1, 1)
+
+# BYDAY codes, indexed by datetime.weekday()
+WEEKDAY_CODES = ('MO', 'TU', 'WE', 'TH', 'FR', 'SA', 'SU')
+
+# Octets per content line, CRLF excluded (RFC 5545 section 3.1)
+FOLD_LENGTH = 75
+
+
+# ==========================================================
+# VALUE FORMATTING
+# ==========================================================
+def escape_text(value):
+    """Escape a TEXT value (RFC 5545 section 3.3.11)."""
+    return (str(value or '')
+            .replace('\\', '\\\\')
+            .replace(';', '\\;')
+            .replace(',', '\\,')
+            .replace('\r\n', '\\n')
+            .replace('\n', '\\n'))
+
+
+def _param_value(value):
+    # DQUOTE is not allowed inside a parameter value
+    value = str(value or '').replace('"', "'")
+    if any(c in value for c in ':;,'):
+        return '"%s"' % value
+    return value
+
+
+def fold_line(line):
+    """Fold a content line at 75 octets without splitting UTF-8 sequences."""
+    encoded = line.encode('utf-8')
+    if len(encoded) <= FOLD_LENGTH:
+        return line
+    parts = []
+    limit = FOLD_LENGTH
+    while encoded:
+        cut = min(limit, len(encoded))
+        # Step back to a character boundary (continuation bytes are 10xxxxxx)
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode('utf-8'))
+        encoded = encoded[cut:]
+        # Continuation lines start with a space, which counts in the 75 octets
+        limit = FOLD_LENGTH - 1
+    return '\r\n '.join(parts)
+
+
+def format_local(dt):
+    """Floating DATE-TIME (used with TZID): 20240131T093000."""
+    return '%04d%02d%02dT%02d%02d%02d' % (dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second)
+
+
+def format_utc(dt):
+    """UTC DATE-TIME of a naive UTC or aware datetime: 20240131T093000Z."""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(pytz.utc).replace(tzinfo=None)
+    return format_local(dt) + 'Z'
+
+
+def format_offset(offset):
+    """UTC-OFFSET value: +0700, -0330, +051736."""
+    seconds = int(offset.total_seconds())
+    sign = '-' if seconds < 0 else '+'
+    hours, remainder = divmod(abs(seconds), 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return '%s%02d%02d%s' % (sign, hours, minutes, '%02d' % seconds if seconds else '')
+
+
+def attendee_line(name, email):
+    """Unfolded ATTENDEE property of an invitee (RSVP requested)."""
+    return 'ATTENDEE;ROLE=REQ-PARTICIPANT;PARTSTAT=NEEDS-ACTION;RSVP=TRUE;CN=%s:mailto:%s' % (
+        _param_value(name or email), email)
+
+
+def make_uid(prefix, res_id, domain):
+    """
+    Globally unique, stable UID of a record.
+
+    Args:
+        prefix: Record kind, e.g. 'meeting_event'
+        res_id: Record id
+        domain: Database-wide unique part (database.uuid)
+    """
+    return '%s_%s@%s' % (prefix, res_id, domain or 'odoo')
+
+
+# ==========================================================
+# VTIMEZONE
+# ==========================================================
+@functools.lru_cache(maxsize=512)
+def tz_observances(tzid, year):
+    """
+    Observances needed to resolve local times of a given year.
+
+    Returns the observance in effect on January 1st followed by every
+    transition of the year, as a tuple of
+    (kind, onset_local, offset_from, offset_to, tzname) sorted by onset.
+    """
+    tz = tz_service.get_tz(tzid)
+    transitions = getattr(tz, '_utc_transition_times', None)
+    if not transitions:
+        # Fixed offset zone (UTC, Etc/GMT+7...)
+        probe = datetime(year, 1, 1)
+        offset = tz.utcoffset(probe) or timedelta(0)
+        return (('STANDARD', ICS_EPOCH, offset, offset, tz.tzname(probe) or tzid),)
+
+    infos = tz._transition_info
+    year_start = datetime(year, 1, 1)
+    year_end = datetime(year + 1, 1, 1)
+    first = max(bisect_right(transitions, year_start) - 1, 0)
+    observances = []
+    for index in range(first, len(transitions)):
+        if transitions[index] >= year_end:
+            break
+        offset_to, dst, tzname = infos[index]
+        offset_from = infos[index - 1][0] if index else offset_to
+        if index == first and transitions[index] < ICS_EPOCH:
+            onset = ICS_EPOCH
+        else:
+            # DTSTART of an observance is the local time before the transition
+            onset = transitions[index] + offset_from
+        observances.append(('DAYLIGHT' if dst else 'STANDARD', onset, offset_from, offset_to, tzname))
+    return tuple(observances)
+
+
+def vtimezone_lines(tzid, years):
+    """
+    VTIMEZONE component covering the given years.
+
+    Args:
+        tzid: Olson timezone name
+        years: Iterable of years used by the events of the calendar
+    """
+    years = sorted(set(years))
+    observances = sorted(set(obs for year in years for obs in tz_observances(tzid, year)),
+                         key=lambda obs: obs[1])
+    rules = _recurring_observances(tzid, observances) if years and years[-1] > _table_end_year(tzid) else {}
+    lines = ['BEGIN:VTIMEZONE', 'TZID:%s' % tzid, 'X-LIC-LOCATION:%s' % tzid]
+    for observance in observances:
+        kind, onset, offset_from, offset_to, tzname = observance
+        lines += [
+            'BEGIN:%s' % kind,
+            'DTSTART:%s' % format_local(onset),
+        ]
+        if observance in rules:
+            lines.append('RRULE:%s' % rules[observance])
+        lines += [
+            'TZOFFSETFROM:%s' % format_offset(offset_from),
+            'TZOFFSETTO:%s' % format_offset(offset_to),
+            'TZNAME:%s' % escape_text(tzname),
+            'END:%s' % kind,
+        ]
+    lines.append('END:VTIMEZONE')
+    return lines
+
+
+def _table_end_year(tzid):
+    """Last year with a transition in the pytz table (pytz stops at 2037)."""
+    transitions = getattr(tz_service.get_tz(tzid), '_utc_transition_times', None)
+    return transitions[-1].year if transitions else datetime.max.year
+
+
+def yearly_rule(onset):
+    """
+    RRULE repeating a DST onset every year on the same weekday of its month.
+
+    e.g. 2037-03-08 (2nd Sunday) -> FREQ=YEARLY;BYMONTH=3;BYDAY=2SU,
+    2037-10-25 (last Sunday) -> FREQ=YEARLY;BYMONTH=10;BYDAY=-1SU
+    """
+    days_in_month = calendar.monthrange(onset.year, onset.month)[1]
+    nth = '-1' if onset.day + 7 > days_in_month else str((onset.day - 1) // 7 + 1)
+    return 'FREQ=YEARLY;BYMONTH=%d;BYDAY=%s%s' % (onset.month, nth, WEEKDAY_CODES[onset.weekday()])
+
+
+def _recurring_observances(tzid, observances):
+    """
+    Last DAYLIGHT and STANDARD observances of the table, made yearly.
+
+    Events beyond the pytz table would otherwise resolve with the last
+    one-off observance, i.e. without DST for every later year.
+
+    Returns:
+        Dict observance -> RRULE value (empty if the zone no longer observes DST)
+    """
+    end_year = _table_end_year(tzid)
+    last = {}
+    for observance in observances:
+        if observance[1].year == end_year:
+            last[observance[0]] = observance
+    if set(last) != {'DAYLIGHT', 'STANDARD'}:
+        return {}
+    return {observance: yearly_rule(observance[1]) for observance in last.values()}
+
+
+# ==========================================================
+# CALENDAR
+# ==========================================================
+class ICSCalendar(object):
+    """
+    VCALENDAR accumulating VEVENTs, serialized in memory.
+
+    Usage:
+        cal = ICSCalendar(method='REQUEST')
+        cal.add_event(uid, start, end, tzid='Asia/Jakarta', summary='Weekly')
+        datas = base64.b64encode(cal.to_bytes())
+    """
+
+    def __init__(self, method=None, prodid=PRODID, name=None):
+        self.method = method
+        self.prodid = prodid
+        self.name = name
+        self._events = []
+        self._tz_years = {}
+
+    def __len__(self):
+        return len(self._events)
+
+    def add_event(self, uid, start, end, tzid='UTC', summary=None, description=None, location=None,
+                  dtstamp=None, last_modified=None, sequence=None, organizer=None, attendees=(),
+                  alarm_minutes=None, status=None, url=None, rrule=None, exdates=(), recurrence_id=None,
+                  series_last_start=None):
+        """
+        Add a VEVENT.
+
+        Args:
+            uid: Stable UID (see make_uid)
+            start: Naive UTC start
+            end: Naive UTC end
+            tzid: Timezone the event is expressed in
+            organizer: Tuple (name, email)
+            attendees: Iterable of (name, email) tuples
+            alarm_minutes: Display reminder before start, in minutes
+            status: CONFIRMED / TENTATIVE / CANCELLED
+            rrule: RRULE value of a recurring event (see recurrence.rrule_string)
+            exdates: Naive UTC starts of cancelled occurrences
+            recurrence_id: Naive UTC original start, when overriding one occurrence of a series
+            series_last_start: Naive UTC start of the last occurrence (VTIMEZONE covers the whole series)
+        """
+        tzid = tzid or 'UTC'
+        local_start = tz_service.to_local(start, tzid)
+        local_end = tz_service.to_local(series_last_start or end, tzid)
+        self._tz_years.setdefault(tzid, set()).update(range(local_start.year, local_end.year + 1))
+
+        lines = [
+            'BEGIN:VEVENT',
+            'UID:%s' % uid,
+            'DTSTAMP:%s' % format_utc(dtstamp or datetime.utcnow()),
+            'DTSTART;TZID=%s:%s' % (tzid, format_local(local_start)),
+            'DTEND;TZID=%s:%s' % (tzid, format_local(tz_service.to_local(end, tzid))),
+        ]
+        if recurrence_id:
+            lines.append('RECURRENCE-ID;TZID=%s:%s' % (tzid, format_local(tz_service.to_local(recurrence_id, tzid))))
+        if rrule:
+            lines.append('RRULE:%s' % rrule)
+        if exdates:
+            lines.append('EXDATE;TZID=%s:%s' % (tzid, ','.join(
+                format_local(tz_service.to_local(exdate, tzid)) for exdate in sorted(exdates))))
+        if sequence is not None:
+            lines.append('SEQUENCE:%d' % sequence)
+        if last_modified:
+            lines.append('LAST-MODIFIED:%s' % format_utc(last_modified))
+        if status:
+            lines.append('STATUS:%s' % status)
+        lines.append('SUMMARY:%s' % escape_text(summary))
+        if description:
+            lines.append('DESCRIPTION:%s' % escape_text(description))
+        if location:
+            lines.append('LOCATION:%s' % escape_text(location))
+        if url:
+            lines.append('URL:%s' % url)
+        if organizer and organizer[1]:
+            lines.append('ORGANIZER;CN=%s:mailto:%s' % (_param_value(organizer[0]), organizer[1]))
+        for name, email in attendees:
+            if email:
+                lines.append(attendee_line(name, email))
+        if alarm_minutes:
+            lines += [
+                'BEGIN:VALARM',
+                'TRIGGER:-PT%dM' % alarm_minutes,
+                'ACTION:DISPLAY',
+                'DESCRIPTION:Reminder',
+                'END:VALARM',
+            ]
+        lines.append('END:VEVENT')
+        self._events.append(lines)
+
+    def to_string(self):
+        lines = ['BEGIN:VCALENDAR', 'VERSION:2.0', 'PRODID:%s' % self.prodid, 'CALSCALE:GREGORIAN']
+        if self.method:
+            lines.append('METHOD:%s' % self.method)
+        if self.name:
+            lines.append('X-WR-CALNAME:%s' % escape_text(self.name))
+        for tzid in sorted(self._tz_years):
+            lines += vtimezone_lines(tzid, self._tz_years[tzid])
+        for event in self._events:
+            lines += event
+        lines.append('END:VCALENDAR')
+        return '\r\n'.join(fold_line(line) for line in lines) + '\r\n'
+
+    def to_bytes(self):
+        return self.to_string().encode('utf-8')
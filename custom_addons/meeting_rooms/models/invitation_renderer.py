@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""
+Invitation body rendering.
+
+Invitation templates (views/invitation_templates.xml) are compiled and
+cached by QWeb. They are rendered once per meeting and timezone with the
+recipient name replaced by a placeholder; personalizing each of N
+recipients is then a single str.replace instead of N full renders.
+"""
+from odoo.tools import html_escape
+
+# Plain ASCII marker, left untouched by QWeb's HTML escaping
+RECIPIENT_PLACEHOLDER = '%%MEETING_RECIPIENT_NAME%%'
+
+
+def render_static(env, template, values):
+    """
+    Render the recipient-independent part of an invitation template.
+
+    Args:
+        env: Odoo environment
+        template: XML id of the QWeb template
+        values: Rendering values (without recipient_name)
+
+    Returns:
+        HTML string containing RECIPIENT_PLACEHOLDER
+    """
+    html = env['ir.ui.view'].render_template(template, dict(values, recipient_name=RECIPIENT_PLACEHOLDER))
+    if isinstance(html, bytes):
+        html = html.decode('utf-8')
+    return str(html)
+
+
+def personalize(static_html, recipient_name):
+    """Insert the (escaped) recipient name into a rendered static part."""
+    return static_html.replace(RECIPIENT_PLACEHOLDER, str(html_escape(recipient_name or '')))
@@ -4,6 +4,13 @@ from odoo.exceptions import AccessDenied, UserError, ValidationError
 import pytz
 import subprocess
 import base64
+import logging
+
+from .ics_builder import ICSCalendar, make_uid
+from . import tz_service
+from . import recurrence
+
+_logger = logging.getLogger(__name__)
 
 # put POSIX 'Etc/*' entries at the end to avoid confusing users - see bug 1086728
 _tzs = [(tz, tz) for tz in sorted(pytz.all_timezones, key=lambda tz: tz if not tz.startswith('Etc/') else '_')]
@@ -28,22 +35,15 @@ class MeetingRoomsLocation(models.Model):
         for record in self:
             timezone = record.tz or 'UTC'  # Default to UTC if no timezone is set
 
-            time_zone = pytz.timezone(timezone)
-            current_time = datetime.now(pytz.utc).astimezone(time_zone)
-
-            timezone_offset = current_time.utcoffset().total_seconds() / 60
-
-            offset_hours = int(timezone_offset // 60)
-            offset_minutes = int(abs(timezone_offset) % 60)
-
-            # Format the offset (e.g., +08:00, -05:30, etc.)
-            record.tz_offset = f"{'+' if offset_hours >= 0 else '-'}{abs(offset_hours):02d}{abs(offset_minutes):02d}"
+            # Format the offset (e.g., +0800, -0530, etc.)
+            record.tz_offset = tz_service.current_offset_str(timezone)
 
 
 class MeetingRooms(models.Model):
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'meeting.booking.exclusion.mixin']
     _name = 'meeting.rooms'
     _description = 'Meeting Rooms Booking'
+    _exclusion_resource = 'room_location'
 
     name = fields.Char("Name")
     subject = fields.Char("Subject")
@@ -123,6 +123,14 @@ class MeetingRooms(models.Model):
             "Please go to 'Meeting Events' menu to manage schedules."
         ))
 
+    def init(self):
+        """Index the per-room overlap lookups of _check_booking_validity (runs on install/update)."""
+        super(MeetingRooms, self).init()
+        self.env.cr.execute("""
+            CREATE INDEX IF NOT EXISTS meeting_rooms_location_dates_idx
+                ON meeting_rooms (room_location, start_date, end_date)
+        """)
+
     def _get_display_tz_name(self):
         self.ensure_one()
         event = getattr(self, 'meeting_event_id', False)
@@ -133,69 +141,30 @@ class MeetingRooms(models.Model):
         return 'UTC'
 
     def _convert_utc_to_tz(self, dt, tz_name):
-        if not dt:
-            return dt
-        tz = pytz.timezone(tz_name or 'UTC')
-        if dt.tzinfo is None:
-            dt = pytz.utc.localize(dt)
-        return dt.astimezone(tz)
+        return tz_service.to_local(dt, tz_name)
 
     def _tz_offset_str(self, tz_name, ref_dt=None):
         if not ref_dt:
-            ref_dt = fields.Datetime.now()
-        local_dt = self._convert_utc_to_tz(ref_dt, tz_name)
-        utc_offset = local_dt.utcoffset() or timedelta(0)
-        offset_total_seconds = utc_offset.total_seconds()
-        offset_hours = int(offset_total_seconds // 3600)
-        offset_minutes = int(abs(offset_total_seconds) % 3600 // 60)
-        return f"{'+' if offset_hours >= 0 else '-'}{abs(offset_hours):02d}{abs(offset_minutes):02d}"
+            return tz_service.current_offset_str(tz_name or 'UTC')
+        return tz_service.offset_str(ref_dt, tz_name)
 
     @api.depends('start_date', 'end_date')
     def _compute_utc_date_strings(self):
-        """
-        DEBUG MODE: Check current user timezone.
-        """
-        # --- ADD THIS LOG FOR DEBUGGING ---
-        import logging
-        _logger = logging.getLogger(__name__)
-        
-        current_user = self.env.user
-        context_tz = self.env.context.get('tz')
-        
-        _logger.info("="*50)
-        _logger.info(f"DEBUG TIMEZONE CHECK")
-        _logger.info(f"User Login    : {current_user.name} (ID: {current_user.id})")
-        _logger.info(f"User DB TZ    : {current_user.tz} (Value stored in database)")
-        _logger.info(f"Context TZ    : {context_tz} (Value sent by Browser/Session)")
-        _logger.info("="*50)
-        # -------------------------
-
         """
         Display start and end dates in UTC timezone for reference.
         
         This helps users see the actual UTC values stored in database,
         useful for cross-timezone coordination.
+        
+        Timezone diagnostics are opt-in: enable DEBUG on this module's logger
+        (--log-handler=odoo.addons.meeting_rooms.models:DEBUG).
         """
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug("Timezone check: user %s, user tz %s, context tz %s, %s records",
+                          self.env.uid, self.env.user.tz, self.env.context.get('tz'), len(self))
         for rec in self:
-            if rec.start_date:
-                start_dt = rec.start_date
-                if isinstance(start_dt, str):
-                    start_dt = fields.Datetime.to_datetime(start_dt)
-                if start_dt.tzinfo is None:
-                    start_dt = pytz.utc.localize(start_dt)
-                rec.start_date_utc_str = start_dt.strftime('%Y-%m-%d %H:%M:%S UTC')
-            else:
-                rec.start_date_utc_str = ''
-
-            if rec.end_date:
-                end_dt = rec.end_date
-                if isinstance(end_dt, str):
-                    end_dt = fields.Datetime.to_datetime(end_dt)
-                if end_dt.tzinfo is None:
-                    end_dt = pytz.utc.localize(end_dt)
-                rec.end_date_utc_str = end_dt.strftime('%Y-%m-%d %H:%M:%S UTC')
-            else:
-                rec.end_date_utc_str = ''
+            rec.start_date_utc_str = tz_service.format_utc(rec.start_date)
+            rec.end_date_utc_str = tz_service.format_utc(rec.end_date)
 
     @api.depends('start_date', 'end_date')
     def _compute_user_view_time(self):
@@ -210,27 +179,21 @@ class MeetingRooms(models.Model):
         - User Login Makassar → "12/02/2026 15:00:00 (Asia/Makassar)"
         - User Login Jayapura → "12/02/2026 16:00:00 (Asia/Jayapura)"
         """
+        # Get timezone of the user currently viewing this screen
+        current_user_tz = self.env.user.tz or 'UTC'
+        tz_name = tz_service.safe_tz_name(current_user_tz)
+        local_times = tz_service.bulk_local_times(self, [tz_name])
+
         for rec in self:
-            # Get timezone of the user currently viewing this screen
-            current_user_tz = self.env.user.tz or 'UTC'
-            
-            try:
-                tz = pytz.timezone(current_user_tz)
-            except:
-                tz = pytz.utc
-            
+            local_start, local_end = local_times[(rec.id, tz_name)]
             # Convert Start Date
-            if rec.start_date:
-                utc_start = pytz.utc.localize(rec.start_date)
-                local_start = utc_start.astimezone(tz)
+            if local_start:
                 rec.user_view_start_date = f"{local_start.strftime('%d/%m/%Y %H:%M:%S')} ({current_user_tz})"
             else:
                 rec.user_view_start_date = "Not Set"
             
             # Konversi End Date
-            if rec.end_date:
-                utc_end = pytz.utc.localize(rec.end_date)
-                local_end = utc_end.astimezone(tz)
+            if local_end:
                 rec.user_view_end_date = f"{local_end.strftime('%d/%m/%Y %H:%M:%S')} ({current_user_tz})"
             else:
                 rec.user_view_end_date = "Not Set"
@@ -242,86 +205,60 @@ class MeetingRooms(models.Model):
             return event.create_calendar_web()
         for rec in self :
             tz_name = rec._get_display_tz_name()
-            start_time = rec._convert_utc_to_tz(rec.start_date, tz_name)
-            end_time = rec._convert_utc_to_tz(rec.end_date, tz_name)
-            create_time = rec._convert_utc_to_tz(rec.create_date, tz_name)
-            write_time = rec._convert_utc_to_tz(rec.write_date, tz_name)
-            tz_offset_str = rec._tz_offset_str(tz_name, rec.start_date)
-            reminder = int(rec.calendar_alarm.duration) if rec.calendar_alarm.duration else 1
-            attendee_str = ''
-            for user in rec.attendee :
-                attendee_str += f'ATTENDEE;ROLE=REQ-PARTICIPANT;RSVP=TRUE;CN="{user.display_name}":mailto:{user.email}'
-                if user != rec.attendee[-1]:
-                    attendee_str += '\n'
-            icsContent = f"""BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//ZContent.net//Zap Calendar 1.0//EN
-CALSCALE:GREGORIAN
-METHOD:REQUEST
-
-BEGIN:VTIMEZONE
-TZID:{tz_name}
-X-LIC-LOCATION:${tz_name}
-BEGIN:STANDARD
-DTSTART:19700101T000000
-TZOFFSETFROM:{tz_offset_str}
-TZOFFSETTO:{tz_offset_str}
-TZNAME:${tz_name}
-END:STANDARD
-END:VTIMEZONE
-
-BEGIN:VEVENT
-UID:{rec.id}
-SEQUENCE:{rec.version}
-SUMMARY:{rec.subject}
-DTSTAMP:{create_time}
-LAST-MODIFIED:{write_time}
-DTSTART;TZID={tz_name}:{start_time}
-DTEND;TZID={tz_name}:{end_time}
-LOCATION:{rec.room_location.name}
-DESCRIPTION:{rec.description}
-ORGANIZER;PARTSTAT=ACCEPTED;CN="{rec.create_uid.display_name}":mailto:{rec.create_uid.email}
-{attendee_str}
-BEGIN:VALARM
-TRIGGER:-PT${reminder}M
-ACTION:DISPLAY
-DESCRIPTION:Reminder
-END:VALARM
-END:VEVENT
-END:VCALENDAR`;
-            """
-            filename = f"{rec.subject}.ics"
-            with open(filename, 'w') as file:
-                file.write(icsContent)
-
-            with open(filename, 'rb') as file:
-                attachment_calendar = self.env['ir.attachment'].sudo().search(
-                    [('res_model', '=', 'meeting.rooms'), ('type', '=', 'binary'), ('res_field', '=', 'calendar_file'),('res_id', '=', rec.id)])
-                if attachment_calendar:
-                    attachment_calendar.unlink()
-                    attachment = self.env['ir.attachment'].sudo().create({
-                        'name': filename,
-                        'type': 'binary',
-                        'res_model': 'meeting.rooms',
-                        'res_field': 'calendar_file',
-                        'res_id': rec.id,
-                        'res_name': filename,
-                        'datas': base64.b64encode(file.read()),
-                        'public': True
-                    })
-                else:
-                    attachment = self.env['ir.attachment'].sudo().create({
-                        'name': filename,
-                        'type': 'binary',
-                        'res_model': 'meeting.rooms',
-                        'res_field': 'calendar_file',
-                        'res_id': rec.id,
-                        'res_name': filename,
-                        'datas': base64.b64encode(file.read()),
-                        'public': True
-                    })
+            calendar = ICSCalendar(method='REQUEST')
+            calendar.add_event(
+                make_uid('meeting_rooms', rec.id, self.env['ir.config_parameter'].sudo().get_param('database.uuid')),
+                rec.start_date,
+                rec.end_date,
+                tzid=tz_name,
+                summary=rec.subject,
+                description=rec.description,
+                location=rec.room_location.name,
+                dtstamp=rec.create_date,
+                last_modified=rec.write_date,
+                sequence=rec.version,
+                organizer=(rec.create_uid.display_name, rec.create_uid.email),
+                attendees=[(user.display_name, user.email) for user in rec.attendee],
+                alarm_minutes=rec.calendar_alarm.duration_minutes or 1,
+            )
+            # Built and encoded in memory: nothing is written to the working directory
+            rec._upsert_calendar_attachment(f"{rec.subject}.ics", base64.b64encode(calendar.to_bytes()))
+
+    def _upsert_calendar_attachment(self, filename, datas):
+        """
+        Store the calendar file of the meeting, replacing the previous one in place.
 
+        Args:
+            filename: Attachment name
+            datas: Base64 encoded content (bytes)
 
+        Returns:
+            ir.attachment record
+        """
+        self.ensure_one()
+        Attachment = self.env['ir.attachment'].sudo()
+        attachment = Attachment.search([
+            ('res_model', '=', self._name),
+            ('type', '=', 'binary'),
+            ('res_field', '=', 'calendar_file'),
+            ('res_id', '=', self.id),
+        ], limit=1)
+        vals = {
+            'name': filename,
+            'res_name': filename,
+            'datas': datas,
+            'public': True,
+        }
+        if attachment:
+            attachment.write(vals)
+            return attachment
+        vals.update({
+            'type': 'binary',
+            'res_model': self._name,
+            'res_field': 'calendar_file',
+            'res_id': self.id,
+        })
+        return Attachment.create(vals)
 
     def create_calendar_event(self):
         for rec in self :
@@ -474,88 +411,95 @@ END:VCALENDAR`;
             
             if conflicts:
                 # Get first conflict for error message
-                conflict = conflicts[0]
-                tz_name = record._get_display_tz_name()
-                start_time = record._convert_utc_to_tz(conflict.start_date, tz_name)
-                end_time = record._convert_utc_to_tz(conflict.end_date, tz_name)
-                
-                raise ValidationError(
-                    _(f"Room conflict: '{record.room_location.name}' is already booked "
-                      f"from {start_time.strftime('%Y-%m-%d %H:%M')} to {end_time.strftime('%Y-%m-%d %H:%M')}. "
-                      f"Please choose another time slot.")
-                )
-
-    @api.model
-    def create(self, vals):
+                raise ValidationError(record._exclusion_conflict_message(conflicts[0]))
+
+        # Occurrences of recurrent meetings are not stored: expand them over the
+        # stand-alone bookings only, with one set-based pass for the whole recordset
+        standalone = self.filtered(lambda rec: not getattr(rec, 'meeting_event_id', False))
+        results = self.env['meeting.event']._find_occurrence_conflicts_multi([{
+            'occurrences': [(record.start_date, record.end_date)],
+            'location_ids': record.room_location.ids,
+            'include_rows': False,
+        } for record in standalone])
+        for record, series_conflicts in zip(standalone, results):
+            if series_conflicts:
+                raise ValidationError(_(
+                    f"Room conflict: '{record.room_location.name}' is booked at this time by an occurrence "
+                    f"of the recurrent meeting '{series_conflicts[0][2].subject}'. Please choose another time slot."
+                ))
+
+    def _exclusion_conflict_message(self, conflict):
+        """Room conflict message, shared with the database exclusion constraint."""
+        if not conflict:
+            return _("Room conflict: this room is already booked for the selected time. Please choose another time slot.")
+        tz_name = (self[:1] or conflict)._get_display_tz_name()
+        start_time = conflict._convert_utc_to_tz(conflict.start_date, tz_name)
+        end_time = conflict._convert_utc_to_tz(conflict.end_date, tz_name)
+        return _(f"Room conflict: '{conflict.room_location.name}' is already booked "
+                 f"from {start_time.strftime('%Y-%m-%d %H:%M')} to {end_time.strftime('%Y-%m-%d %H:%M')}. "
+                 f"Please choose another time slot.")
+
+    @api.model_create_multi
+    def create(self, vals_list):
         self._check_readonly_access()
 
-        vals['name'] = vals['subject']
-        values = super(MeetingRooms, self).create(vals)
+        for vals in vals_list:
+            vals['name'] = vals['subject']
+        records = super(MeetingRooms, self).create(vals_list)
         # Activity notifications are centralized in meeting.event model
         # to prevent duplicate notifications (one from meeting.event, one from meeting.rooms).
 
+        # Bookings mirrored from a meeting.event are never expanded: the event
+        # generates its occurrences lazily (see recurrence.py)
+        for values in records:
+            if values.recurrency and values.rrule_type and not getattr(values, 'meeting_event_id', False):
+                values._create_recurrent_bookings()
+        return records
+
+    def _create_recurrent_bookings(self):
+        """
+        Create the following occurrences of a stand-alone recurrent booking.
+
+        Occurrences come from the recurrence engine (final_date inclusive,
+        local wall time kept across DST). They are validated against every
+        existing booking in one set-based pass, then created in one batch
+        with the per-record check skipped.
+
+        Returns:
+            The created meeting.rooms records
+        """
+        self.ensure_one()
+        occurrences = list(recurrence.iter_occurrences(
+            self.start_date, self.end_date, self.rrule_type, self.final_date, self._get_display_tz_name(),
+        ))[1:]
+        if not occurrences:
+            return self.browse()
+
         if not self.env.context.get('skip_double_booking_check'):
-            tz_name = values._get_display_tz_name()
-            start_time = values._convert_utc_to_tz(values.start_date, tz_name)
-            end_time = values._convert_utc_to_tz(values.end_date, tz_name)
-            formatted_start_time = start_time.strftime('%b %d, %Y')
-            start_time_hours = start_time.strftime('%H:%M')
-            formatted_end_time = end_time.strftime('%b %d, %Y %H:%M')
-            end_time_hours = end_time.strftime('%H:%M')
-            duration = end_time - start_time
-            meeting_hours, remainder = divmod(duration.total_seconds(), 3600)
-            meeting_minutes, meeting_seconds = divmod(remainder, 60)
-            meeting_hours_str = ""
-            if meeting_hours > 0:
-                meeting_hours_str = f"{int(meeting_hours)} hours "
-
-            meeting_minutes_str = ""
-            if meeting_minutes > 0:
-                meeting_minutes_str = f"{int(meeting_minutes)} minutes"
-
-        if values.recurrency :
-            if values.rrule_type == "daily" :
-                delta = timedelta(days=1)
-                start_date = values.start_date
-                end_date = values.end_date
-                date_count = values.start_date.date()
-                while date_count <= values.final_date :
-                    start_date += delta
-                    end_date += delta
-                    date_count += delta
-                    value = {
-                        'subject' : values.subject,
-                        'name' : values.name,
-                        'start_date' : start_date,
-                        'end_date' : end_date,
-                        'description' : values.description,
-                        'calendar_alarm' : values.calendar_alarm.id,
-                        'attendee' : values.attendee,
-                        'room_location' : values.room_location.id
-                    }
-                    meeting = self.env['meeting.rooms'].sudo().with_context(skip_readonly_check=True).create(value)
-
-            elif values.rrule_type == "weekly":
-                delta = timedelta(days=7)
-                start_date = values.start_date
-                end_date = values.end_date
-                date_count = values.start_date.date()
-                while date_count <= values.final_date:
-                    start_date += delta
-                    end_date += delta
-                    date_count += delta
-                    value = {
-                        'subject': values.subject,
-                        'name': values.name,
-                        'start_date': start_date,
-                        'end_date': end_date,
-                        'description': values.description,
-                        'calendar_alarm': values.calendar_alarm.id,
-                        'attendee': values.attendee,
-                        'room_location': values.room_location.id
-                    }
-                    meeting = self.env['meeting.rooms'].sudo().with_context(skip_readonly_check=True).create(value)
-        return values
+            conflicts = self.env['meeting.event']._find_occurrence_conflicts(
+                occurrences,
+                location_ids=self.room_location.ids,
+                exclude_booking_ids=self.ids,
+            )
+            if conflicts:
+                start, _end, other = min(conflicts, key=lambda conflict: conflict[0])
+                start_time = self._convert_utc_to_tz(start, self._get_display_tz_name())
+                raise ValidationError(_(
+                    f"Room conflict: the occurrence of {start_time.strftime('%Y-%m-%d %H:%M')} in "
+                    f"'{self.room_location.name}' overlaps '{other.subject}' "
+                    f"({len(conflicts)} conflicting booking(s) in the series). Please choose another time slot."
+                ))
+
+        return self.sudo().with_context(skip_readonly_check=True, skip_double_booking_check=True).create([{
+            'subject': self.subject,
+            'name': self.name,
+            'start_date': start,
+            'end_date': end,
+            'description': self.description,
+            'calendar_alarm': self.calendar_alarm.id,
+            'attendee': [(6, 0, self.attendee.ids)],
+            'room_location': self.room_location.id,
+        } for start, end in occurrences])
 
     def write(self, vals):
         """Override write to enforce readonly access control."""
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+Recurrence Engine - lazy expansion of daily/weekly meeting series.
+
+A series is stored as a single row (its first occurrence plus rrule_type
+and final_date). Occurrences are generated on demand for a query window,
+never materialized: the generator seeks straight to the first occurrence
+overlapping the window, so a query next month on a series started years
+ago does not walk through every past occurrence.
+
+Occurrences keep the local wall-clock time of the first one across DST
+changes (a weekly 09:00 meeting stays at 09:00 local). Each occurrence is
+identified by its original UTC start (its recurrence id), which is what
+exceptions (cancelled or moved occurrences) refer to.
+
+All datetimes given to and returned by this module are naive UTC.
+"""
+from datetime import datetime, time, timedelta
+from heapq import merge
+import pytz
+
+from . import tz_service
+
+# Days between two occurrences, per rrule_type
+STEP_DAYS = {
+    'daily': 1,
+    'weekly': 7,
+}
+
+# Safety net for series without an end (or absurdly long ones)
+MAX_OCCURRENCES = 3660
+
+# Exception types
+EXCEPTION_CANCEL = 'cancel'
+EXCEPTION_MOVE = 'move'
+
+
+def _local_to_utc(tz, local_dt):
+    """Naive local wall time to naive UTC (ambiguous/non-existent times resolved like pytz's default)."""
+    return tz.localize(local_dt).astimezone(pytz.utc).replace(tzinfo=None)
+
+
+def last_start(start, rrule_type, final_date, tz_name='UTC'):
+    """
+    UTC start of the last occurrence of a series.
+
+    A series without final_date ends where iter_occurrences() stops, after
+    MAX_OCCURRENCES occurrences (rrule_string() publishes the same COUNT).
+
+    Args:
+        start: First occurrence start
+        rrule_type: 'daily' or 'weekly'
+        final_date: Last allowed local date (inclusive), or None
+        tz_name: Timezone the series repeats in
+
+    Returns:
+        Naive UTC datetime
+    """
+    step = STEP_DAYS[rrule_type]
+    local_start = tz_service.to_local(start, tz_name).replace(tzinfo=None)
+    if final_date:
+        count = min(max((final_date - local_start.date()).days // step, 0), MAX_OCCURRENCES - 1)
+    else:
+        count = MAX_OCCURRENCES - 1
+    return _local_to_utc(tz_service.get_tz(tz_name), local_start + timedelta(days=count * step))
+
+
+def iter_occurrences(start, end, rrule_type, final_date, tz_name='UTC', window_start=None, window_end=None):
+    """
+    Lazily generate the occurrences of a series overlapping a window.
+
+    A series without rrule_type yields its single occurrence (if in the window).
+
+    Args:
+        start: First occurrence start
+        end: First occurrence end
+        rrule_type: 'daily', 'weekly' or False
+        final_date: Last allowed local date (inclusive), or None for no end
+        tz_name: Timezone the series repeats in (keeps local wall time across DST)
+        window_start: Only occurrences ending after this are generated (None: from the first one)
+        window_end: Only occurrences starting before this are generated (None: until final_date)
+
+    Yields:
+        Tuples (start, end) in chronological order
+    """
+    if not start or not end:
+        return
+    step = STEP_DAYS.get(rrule_type)
+    if not step:
+        if (window_start is None or end > window_start) and (window_end is None or start < window_end):
+            yield start, end
+        return
+
+    tz = tz_service.get_tz(tz_name)
+    local_start = tz_service.to_local(start, tz_name).replace(tzinfo=None)
+    duration = end - start
+
+    index = 0
+    if window_start is not None and window_start > end:
+        # Seek: skip whole periods arithmetically, one step early to absorb DST shifts
+        index = max(int((window_start - end).total_seconds() // (step * 86400)) - 1, 0)
+
+    while index < MAX_OCCURRENCES:
+        local = local_start + timedelta(days=index * step)
+        if final_date and local.date() > final_date:
+            return
+        occ_start = _local_to_utc(tz, local)
+        if window_end is not None and occ_start >= window_end:
+            return
+        occ_end = occ_start + duration
+        if window_start is None or occ_end > window_start:
+            yield occ_start, occ_end
+        index += 1
+
+
+def iter_series(start, end, rrule_type, final_date, tz_name='UTC', window_start=None, window_end=None, exceptions=None):
+    """
+    Occurrences of a series in a window, with its exceptions applied.
+
+    Args:
+        start, end, rrule_type, final_date, tz_name, window_start, window_end: See iter_occurrences()
+        exceptions: Dict recurrence id -> None (cancelled) or (start, end) (moved)
+
+    Yields:
+        Tuples (recurrence_id, start, end) sorted by start. recurrence_id is the
+        original UTC start of the occurrence.
+    """
+    exceptions = exceptions or {}
+
+    def _regular():
+        for occ_start, occ_end in iter_occurrences(start, end, rrule_type, final_date, tz_name,
+                                                   window_start, window_end):
+            if occ_start not in exceptions:
+                yield occ_start, occ_start, occ_end
+
+    # Moved occurrences may land in the window from outside of it
+    moved = sorted(
+        (moved_start, recurrence_id, moved_end)
+        for recurrence_id, value in exceptions.items() if value
+        for moved_start, moved_end in (value,)
+        if (window_start is None or moved_end > window_start) and (window_end is None or moved_start < window_end)
+    )
+    moved = ((recurrence_id, moved_start, moved_end) for moved_start, recurrence_id, moved_end in moved)
+
+    for occurrence in merge(_regular(), moved, key=lambda occ: occ[1]):
+        yield occurrence
+
+
+def until_utc(final_date, tz_name='UTC'):
+    """Naive UTC end of final_date (last second of that local day in tz_name)."""
+    return _local_to_utc(tz_service.get_tz(tz_name), datetime.combine(final_date, time.max.replace(microsecond=0)))
+
+
+def rrule_string(rrule_type, final_date, tz_name='UTC'):
+    """
+    RFC 5545 RRULE value of a series.
+
+    UNTIL is given in UTC (required when DTSTART carries a TZID): the end of
+    final_date in the series timezone. A series without final_date gets
+    COUNT=MAX_OCCURRENCES, the bound iter_occurrences() expands to.
+
+    Returns:
+        String such as 'FREQ=WEEKLY;UNTIL=20250131T165959Z', or None if not recurrent
+    """
+    if rrule_type not in STEP_DAYS:
+        return None
+    rule = 'FREQ=%s' % rrule_type.upper()
+    if final_date:
+        rule += ';UNTIL=%s' % until_utc(final_date, tz_name).strftime('%Y%m%dT%H%M%SZ')
+    else:
+        rule += ';COUNT=%d' % MAX_OCCURRENCES
+    return rule
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+from odoo import models, fields, api, _
+from odoo.exceptions import ValidationError
+
+from .recurrence import EXCEPTION_CANCEL, EXCEPTION_MOVE
+
+
+class MeetingEventException(models.Model):
+    """
+    Exception to one occurrence of a recurring meeting.event.
+
+    Occurrences are never stored (see recurrence.py); only the ones that
+    differ from the rule are: a cancelled occurrence, or one moved to
+    another time. recurrence_id is the original UTC start of the occurrence.
+    """
+    _name = 'meeting.event.exception'
+    _description = 'Recurring Meeting Exception'
+    _order = 'event_id, recurrence_id'
+
+    event_id = fields.Many2one('meeting.event', string="Meeting", required=True, ondelete='cascade', index=True)
+    recurrence_id = fields.Datetime("Original Start", required=True,
+                                    help="Start of the occurrence as generated by the recurrence rule")
+    exception_type = fields.Selection([
+        (EXCEPTION_CANCEL, 'Cancelled'),
+        (EXCEPTION_MOVE, 'Moved'),
+    ], string="Type", required=True, default=EXCEPTION_CANCEL)
+    start_date = fields.Datetime("New Start")
+    end_date = fields.Datetime("New End")
+
+    _sql_constraints = [
+        ('event_recurrence_uniq', 'UNIQUE(event_id, recurrence_id)',
+         'An occurrence can only have one exception.'),
+    ]
+
+    @api.constrains('exception_type', 'start_date', 'end_date')
+    def _check_moved_dates(self):
+        for exc in self:
+            if exc.exception_type != EXCEPTION_MOVE:
+                continue
+            if not exc.start_date or not exc.end_date or exc.end_date <= exc.start_date:
+                raise ValidationError(_("A moved occurrence needs an end date after its start date."))
+
+    @api.constrains('exception_type', 'start_date', 'end_date', 'recurrence_id')
+    def _check_moved_conflicts(self):
+        """Moved occurrences are validated like the rest of their series."""
+        if self.env.context.get('skip_double_booking_check'):
+            return
+        self.mapped('event_id')._check_recurrence_conflicts()
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        res = super(MeetingEventException, self).create(vals_list)
+        res.mapped('event_id')._on_exceptions_changed()
+        return res
+
+    def write(self, vals):
+        res = super(MeetingEventException, self).write(vals)
+        self.mapped('event_id')._on_exceptions_changed()
+        return res
+
+    def unlink(self):
+        events = self.mapped('event_id')
+        res = super(MeetingEventException, self).unlink()
+        events.exists()._on_exceptions_changed()
+        return res
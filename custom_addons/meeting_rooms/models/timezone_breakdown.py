@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""
+Timezone Breakdown - cached rendering of the multi-timezone table.
+
+A breakdown is described by structured rows (icon, label, tz_name) built
+once per recordset; the HTML table of a given (rows, start, end) is
+rendered once per process and shared by every meeting with the same
+rooms, timezones and times (recurring series, bulk confirms, imports).
+"""
+import functools
+
+from odoo.tools import html_escape
+
+from . import tz_service
+
+ROOM_ICON = '🏢'
+VIRTUAL_ICON = '🎥'
+
+_TABLE_START = """
+            <table style="width:100%; font-size:13px; color:#444; border:1px solid #eee; background-color:#f9f9f9;">
+                <tr style="background-color:#efefef;">
+                    <th style="padding:5px; text-align:left;">Location</th>
+                    <th style="padding:5px; text-align:left;">Local Time</th>
+                </tr>
+            """
+
+_ROW = """
+                    <tr>
+                        <td style="padding:5px; border-bottom:1px solid #eee;">{icon} {label}</td>
+                        <td style="padding:5px; border-bottom:1px solid #eee;">
+                            <b>{start} - {end}</b> <span style="color:#888; font-size:11px;">({tz})</span>
+                        </td>
+                    </tr>
+                    """
+
+
+@functools.lru_cache(maxsize=1024)
+def render_table(rows, start, end):
+    """
+    HTML table of local start/end times, one line per row.
+
+    Args:
+        rows: Tuple of (icon, label, tz_name) tuples (hashable cache key)
+        start: Naive UTC start
+        end: Naive UTC end
+
+    Returns:
+        HTML string
+    """
+    html = _TABLE_START
+    for icon, label, tz_name in rows:
+        html += _ROW.format(
+            icon=icon,
+            label=html_escape(label),
+            start=tz_service.format_local(start, tz_name, '%H:%M'),
+            end=tz_service.format_local(end, tz_name, '%H:%M'),
+            tz=tz_name,
+        )
+    html += "</table>"
+    return html
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+Timezone Service - memoized UTC to local time conversion.
+
+Every meeting model, mail loop and controller converts the same few
+(timezone, UTC datetime) pairs over and over: list views render the same
+meetings for the same user, invitation loops convert one meeting for
+many recipients sharing a timezone. Conversions and their formatted
+strings are cached here, keyed by (tz_name, utc_datetime).
+
+All datetimes given to this module are UTC, naive (as Odoo stores them)
+or aware. Returned local datetimes are aware.
+"""
+from datetime import datetime, timedelta
+import functools
+import pytz
+
+# Distinct (tz, datetime) pairs kept per process
+CACHE_SIZE = 8192
+
+
+@functools.lru_cache(maxsize=None)
+def get_tz(tz_name):
+    """pytz timezone for a name; empty names mean UTC. Raises UnknownTimeZoneError."""
+    return pytz.timezone(tz_name or 'UTC')
+
+
+def safe_tz_name(tz_name):
+    """Return tz_name if it is a known timezone, else 'UTC'."""
+    try:
+        get_tz(tz_name)
+    except pytz.UnknownTimeZoneError:
+        return 'UTC'
+    return tz_name or 'UTC'
+
+
+def _utc_naive(dt):
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(pytz.utc).replace(tzinfo=None)
+    return dt
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _to_local(tz_name, utc_dt):
+    return pytz.utc.localize(utc_dt).astimezone(get_tz(tz_name))
+
+
+def to_local(utc_dt, tz_name):
+    """
+    Convert a UTC datetime to a timezone (DST is resolved at that date).
+
+    Args:
+        utc_dt: UTC datetime (naive or aware), may be False/None
+        tz_name: Olson timezone name
+
+    Returns:
+        Aware local datetime, or utc_dt unchanged when empty
+    """
+    if not utc_dt:
+        return utc_dt
+    return _to_local(tz_name or 'UTC', _utc_naive(utc_dt))
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _format_local(tz_name, utc_dt, fmt):
+    return _to_local(tz_name, utc_dt).strftime(fmt)
+
+
+def format_local(utc_dt, tz_name, fmt):
+    """strftime of the local time, memoized per (tz_name, utc_dt, fmt). Empty dates give ''."""
+    if not utc_dt:
+        return ''
+    return _format_local(tz_name or 'UTC', _utc_naive(utc_dt), fmt)
+
+
+def format_utc(utc_dt, fmt='%Y-%m-%d %H:%M:%S UTC'):
+    """strftime of a UTC datetime. Empty dates give ''."""
+    return format_local(utc_dt, 'UTC', fmt)
+
+
+def format_offset(offset):
+    """UTC offset as '+0700' / '-0330'."""
+    total_seconds = (offset or timedelta(0)).total_seconds()
+    sign = '+' if total_seconds >= 0 else '-'
+    hours, remainder = divmod(int(abs(total_seconds)), 3600)
+    return '%s%02d%02d' % (sign, hours, remainder // 60)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _offset_str(tz_name, utc_dt):
+    return format_offset(_to_local(tz_name, utc_dt).utcoffset())
+
+
+def offset_str(utc_dt, tz_name):
+    """UTC offset of a timezone at a given UTC datetime, as '+0700'."""
+    return _offset_str(tz_name or 'UTC', _utc_naive(utc_dt))
+
+
+def current_offset_str(tz_name):
+    """UTC offset of a timezone right now (not cached: the key changes every call)."""
+    return format_offset(pytz.utc.localize(datetime.utcnow()).astimezone(get_tz(tz_name)).utcoffset())
+
+
+def bulk_local_times(records, tz_names, fnames=('start_date', 'end_date')):
+    """
+    Convert the dates of a whole recordset into several timezones in one pass.
+
+    Each distinct (timezone, datetime) pair is converted once, whatever the
+    number of records and timezones sharing it.
+
+    Args:
+        records: Recordset (or iterable of records) holding UTC datetime fields
+        tz_names: Iterable of timezone names
+        fnames: Datetime field names to convert
+
+    Returns:
+        Dict (record id, tz_name) -> tuple of aware local datetimes (False when empty), in fnames order
+    """
+    tz_names = set(tz_names)
+    result = {}
+    for rec in records:
+        values = [rec[fname] for fname in fnames]
+        for tz_name in tz_names:
+            result[(rec.id, tz_name)] = tuple(to_local(value, tz_name) for value in values)
+    return result
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+from odoo import models, fields, api
+from datetime import datetime, timedelta
+import json
+import logging
+
+import requests
+
+_logger = logging.getLogger(__name__)
+
+# Retry schedule: 1, 2, 4, 8 ... minutes, never more than one hour apart
+BACKOFF_BASE_SECONDS = 60
+BACKOFF_MAX_SECONDS = 3600
+
+# Jobs handled per cron run (each one may wait on a provider API)
+CRON_BATCH_SIZE = 20
+
+# Provider answers worth retrying besides 5xx (throttling)
+RETRY_STATUSES = (429,)
+
+
+def is_transient(error):
+    """
+    True if a job failure may succeed on a later attempt.
+
+    Only transport errors and provider-side failures (5xx, throttling) are
+    transient. Provider code wraps them in a UserError, so the whole
+    __cause__/__context__ chain is inspected; anything else (configuration,
+    validation, 4xx answers, bugs) fails the job right away.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+            status = error.response.status_code
+            return status >= 500 or status in RETRY_STATUSES
+        if isinstance(error, requests.exceptions.RequestException):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+class MeetingVirtualJob(models.Model):
+    """
+    Durable queue of slow meeting side effects: provider API calls
+    (Zoom / Teams / Google Meet) and invitation delivery.
+
+    Buttons only enqueue a job and return immediately; the worker cron
+    claims due jobs with FOR UPDATE SKIP LOCKED (several cron workers never
+    run the same job), executes them one transaction at a time and
+    reschedules transient failures (see is_transient) with exponential
+    backoff. Other failures are final on the first attempt.
+    """
+    _name = 'meeting.virtual.job'
+    _description = 'Virtual Meeting Job'
+    _order = 'next_attempt, id'
+
+    event_id = fields.Many2one('meeting.event', string="Meeting Event", required=True, ondelete='cascade', index=True)
+    job_type = fields.Selection([
+        ('generate_link', 'Generate Meeting Link'),
+        ('send_invitations', 'Send Invitations'),
+        ('fetch_summary', 'Fetch AI Summary'),
+        ('sync_zoom_occurrences', 'Sync Zoom Occurrences'),
+    ], string="Job", required=True, default='generate_link')
+    payload = fields.Text("Payload (JSON)")
+    user_id = fields.Many2one('res.users', string="Requested By", default=lambda self: self.env.user, ondelete='set null')
+    state = fields.Selection([
+        ('pending', 'Pending'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+        ('cancel', 'Cancelled'),
+    ], string="Status", default='pending', required=True, index=True)
+    attempts = fields.Integer("Attempts", default=0)
+    max_attempts = fields.Integer("Max Attempts", default=5)
+    next_attempt = fields.Datetime("Next Attempt", default=fields.Datetime.now, required=True)
+    last_error = fields.Text("Last Error")
+
+    def init(self):
+        self.env.cr.execute("""
+            CREATE INDEX IF NOT EXISTS meeting_virtual_job_due_idx
+                ON meeting_virtual_job (next_attempt, id) WHERE state = 'pending'
+        """)
+
+    # ==========================================================
+    # QUEUE API
+    # ==========================================================
+    @api.model
+    def _enqueue(self, events, job_type, payload=None, unique=True):
+        """
+        Queue one job per event.
+
+        Args:
+            events: meeting.event recordset
+            job_type: Key of the job_type selection
+            payload: JSON serializable dict passed to the job method
+            unique: Skip events that already have a pending job of that type
+
+        Returns:
+            Newly created jobs
+        """
+        queued = set()
+        if unique:
+            pending = self.sudo().search([
+                ('event_id', 'in', events.ids),
+                ('job_type', '=', job_type),
+                ('state', '=', 'pending'),
+            ])
+            queued = set(pending.mapped('event_id').ids)
+        vals_list = [{
+            'event_id': event.id,
+            'job_type': job_type,
+            'user_id': self.env.user.id,
+            'payload': json.dumps(payload) if payload else False,
+        } for event in events if event.id not in queued]
+        return self.sudo().create(vals_list) if vals_list else self.browse()
+
+    @api.model
+    def _cancel_pending(self, events, job_type):
+        self.sudo().search([
+            ('event_id', 'in', events.ids),
+            ('job_type', '=', job_type),
+            ('state', '=', 'pending'),
+        ]).write({'state': 'cancel'})
+
+    # ==========================================================
+    # WORKER
+    # ==========================================================
+    @api.model
+    def _cron_process_jobs(self, limit=CRON_BATCH_SIZE):
+        """
+        Run due jobs, committing after each one.
+
+        Rows are locked while their job runs, so parallel cron workers pick
+        different jobs instead of blocking on each other.
+        """
+        processed = 0
+        while processed < limit:
+            self.env.cr.execute("""
+                SELECT id FROM meeting_virtual_job
+                 WHERE state = 'pending' AND next_attempt <= (now() at time zone 'UTC')
+                 ORDER BY next_attempt, id
+                 LIMIT 1
+                   FOR UPDATE SKIP LOCKED
+            """)
+            row = self.env.cr.fetchone()
+            if not row:
+                break
+            self.browse(row[0])._run()
+            self.env.cr.commit()
+            processed += 1
+        return processed
+
+    def _run(self):
+        """Execute one job; failures are recorded (and rescheduled if transient), never raised."""
+        self.ensure_one()
+        # Act as the requester (chatter author), with the rights the button already granted
+        event = self.event_id.with_user(self.user_id or self.env.user).sudo()
+        self.attempts += 1
+        self.flush()
+        try:
+            with self.env.cr.savepoint():
+                getattr(event, '_job_%s' % self.job_type)(json.loads(self.payload or '{}'))
+                self.flush()
+        except Exception as e:
+            message = str(getattr(e, 'name', False) or e)
+            # Drop what the failed job left in the cache, it was rolled back
+            self.env.clear()
+            if not is_transient(e) or self.attempts >= self.max_attempts:
+                _logger.error("Virtual job %s (%s) for meeting %s failed permanently: %s", self.id, self.job_type, event.id, message)
+                self.write({'state': 'failed', 'last_error': message})
+                event._job_failed(self.job_type, message)
+            else:
+                delay = min(BACKOFF_BASE_SECONDS * 2 ** (self.attempts - 1), BACKOFF_MAX_SECONDS)
+                _logger.warning("Virtual job %s (%s) for meeting %s failed (attempt %s), retry in %ss: %s",
+                                self.id, self.job_type, event.id, self.attempts, delay, message)
+                self.write({
+                    'last_error': message,
+                    'next_attempt': datetime.utcnow() + timedelta(seconds=delay),
+                })
+            return False
+        self.write({'state': 'done', 'last_error': False})
+        return True
@@ -1,12 +1,37 @@
 # -*- coding: utf-8 -*-
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError
+from odoo.tools.lru import LRU
+from datetime import datetime, timedelta
+import hashlib
+import hmac
 import requests
 import logging
 from requests.auth import HTTPBasicAuth
+from odoo.addons.outbound_http import http_client
 
 _logger = logging.getLogger(__name__)
 
+# Fields whose change invalidates the cached OAuth token
+CREDENTIAL_FIELDS = {
+    'provider', 'email',
+    'zoom_account_id', 'zoom_client_id', 'zoom_client_secret',
+    'google_project_id', 'google_client_email', 'google_private_key',
+}
+
+# Fallback secret token of the Zoom webhook (rooms without their own)
+ZOOM_WEBHOOK_SECRET_PARAM = 'meeting_rooms.zoom_webhook_secret'
+
+# Zoom webhook requests older (or newer) than this are rejected as replays
+ZOOM_WEBHOOK_TOLERANCE = timedelta(minutes=5)
+
+# Tokens are refreshed this long before the provider expiry
+TOKEN_SAFETY_MARGIN = timedelta(minutes=5)
+
+# Process-local copy of the tokens stored on virtual.room:
+# (dbname, room_id) -> (fingerprint, token, expiry)
+_TOKEN_CACHE = LRU(256)
+
 class VirtualRoom(models.Model):
     _name = 'virtual.room'
     _description = 'Virtual Room Configuration'
@@ -29,6 +54,10 @@ class VirtualRoom(models.Model):
     zoom_client_id = fields.Char(string="Client ID", groups="base.group_system")
     zoom_client_secret = fields.Char(string="Client Secret", groups="base.group_system", password=True, encrypt=True)
     
+    zoom_webhook_secret = fields.Char(string="Webhook Secret Token", groups="base.group_system", password=True, encrypt=True,
+                                      help="Secret Token of the Zoom app event subscription (meeting.ended, "
+                                           "meeting.summary_completed) posting to /meeting/zoom/webhook")
+    
     # === GOOGLE CREDENTIALS - ENCRYPTED (For JWT signing) ===
     google_project_id = fields.Char(string="Google Project ID", groups="base.group_system")
     google_client_email = fields.Char(string="Google Client Email", groups="base.group_system")
@@ -37,6 +66,141 @@ class VirtualRoom(models.Model):
     # === STATIC LINK (GOOGLE MEET) ===
     static_link = fields.Char(string="Meeting Link", groups="base.group_system", help="Permanent Google Meet link (e.g. https://meet.google.com/xxx-xxxx-xxx)")
 
+    # === OAUTH TOKEN CACHE (shared by all workers) ===
+    access_token = fields.Char(string="Access Token", groups="base.group_system", copy=False, readonly=True)
+    access_token_expiry = fields.Datetime(string="Access Token Expiry", groups="base.group_system", copy=False, readonly=True)
+    access_token_key = fields.Char(string="Access Token Credentials Fingerprint", groups="base.group_system", copy=False, readonly=True)
+
+    def write(self, vals):
+        """Rotating credentials drops the cached OAuth token."""
+        if CREDENTIAL_FIELDS.intersection(vals):
+            vals = dict(vals, access_token=False, access_token_expiry=False, access_token_key=False)
+            self._forget_token()
+        return super(VirtualRoom, self).write(vals)
+
+    # ==========================================================
+    # OAUTH TOKEN CACHE
+    # ==========================================================
+    def _token_fingerprint(self):
+        """Hash of the credentials a token was issued for (never stored in clear)."""
+        self.ensure_one()
+        room = self.sudo()
+        raw = "\x1f".join(str(room[name] or '') for name in sorted(CREDENTIAL_FIELDS))
+        return hashlib.sha1(raw.encode()).hexdigest()
+
+    def _get_cached_token(self, fetch):
+        """
+        Return a valid OAuth token of this room, fetching a new one only when needed.
+
+        Lookup order: process-local cache, then the token stored on the
+        record by any worker, then the provider. A token is only reused
+        while it is valid for at least TOKEN_SAFETY_MARGIN, so it is
+        refreshed proactively instead of failing mid-request.
+
+        Args:
+            fetch: Callable returning (token, expires_in_seconds) from the provider
+
+        Returns:
+            Access token string
+        """
+        self.ensure_one()
+        key = (self.env.cr.dbname, self.id)
+        fingerprint = self._token_fingerprint()
+        deadline = datetime.utcnow() + TOKEN_SAFETY_MARGIN
+
+        cached = _TOKEN_CACHE.get(key)
+        if cached and cached[0] == fingerprint and cached[2] > deadline:
+            return cached[1]
+
+        self.env.cr.execute("""
+            SELECT access_token, access_token_expiry FROM virtual_room
+             WHERE id = %s AND access_token_key = %s
+        """, (self.id, fingerprint))
+        row = self.env.cr.fetchone()
+        if row and row[0] and row[1] and row[1] > deadline:
+            _TOKEN_CACHE[key] = (fingerprint, row[0], row[1])
+            return row[0]
+
+        token, expires_in = fetch()
+        expiry = datetime.utcnow() + timedelta(seconds=int(expires_in or 3600))
+        _TOKEN_CACHE[key] = (fingerprint, token, expiry)
+        self._store_token(token, expiry, fingerprint)
+        return token
+
+    def _store_token(self, token, expiry, fingerprint):
+        """
+        Publish a token for the other workers in its own transaction.
+
+        The token stays valid even if the caller's transaction rolls back,
+        and a room row locked by a concurrent credentials edit is skipped
+        instead of waited for.
+        """
+        try:
+            with self.pool.cursor() as cr:
+                cr.execute("""
+                    UPDATE virtual_room
+                       SET access_token = %s, access_token_expiry = %s, access_token_key = %s
+                     WHERE id IN (SELECT id FROM virtual_room WHERE id = %s FOR UPDATE SKIP LOCKED)
+                """, (token, expiry, fingerprint, self.id))
+        except Exception as e:
+            _logger.warning("OAuth token of virtual room %s not stored: %s", self.id, e)
+
+    def _forget_token(self):
+        dbname = self.env.cr.dbname
+        for room_id in self.ids:
+            try:
+                del _TOKEN_CACHE[(dbname, room_id)]
+            except KeyError:
+                pass
+
+    # ==========================================================
+    # ZOOM WEBHOOK VERIFICATION
+    # ==========================================================
+    @api.model
+    def _zoom_webhook_sign(self, secret, message):
+        """Hex HMAC-SHA256 of a message with a webhook secret token."""
+        return hmac.new(secret.encode('utf-8'), message.encode('utf-8'), hashlib.sha256).hexdigest()
+
+    @api.model
+    def _match_zoom_webhook(self, body, timestamp, signature):
+        """
+        Find the secret token a Zoom webhook request was signed with.
+
+        Zoom signs "v0:{x-zm-request-timestamp}:{raw body}" with the secret
+        token of the subscription and sends "v0=<hex>" in x-zm-signature.
+        Each Zoom room may have its own subscription, the system parameter
+        meeting_rooms.zoom_webhook_secret serves as a shared fallback.
+
+        Args:
+            body: Raw request body (str)
+            timestamp: x-zm-request-timestamp header (epoch seconds)
+            signature: x-zm-signature header
+
+        Returns:
+            Tuple (virtual.room record, empty for the shared secret; secret), or None if not verified
+        """
+        if not body or not timestamp or not signature:
+            return None
+        try:
+            sent_at = datetime.utcfromtimestamp(int(timestamp))
+        except (TypeError, ValueError, OverflowError):
+            return None
+        if abs(datetime.utcnow() - sent_at) > ZOOM_WEBHOOK_TOLERANCE:
+            _logger.warning("Zoom webhook rejected: timestamp %s out of tolerance", timestamp)
+            return None
+
+        message = 'v0:%s:%s' % (timestamp, body)
+        rooms = self.sudo().search([('provider', '=', 'zoom'), ('zoom_webhook_secret', '!=', False)])
+        candidates = [(room, room.zoom_webhook_secret) for room in rooms]
+        shared = self.env['ir.config_parameter'].sudo().get_param(ZOOM_WEBHOOK_SECRET_PARAM)
+        if shared:
+            candidates.append((self.browse(), shared))
+        for room, secret in candidates:
+            if hmac.compare_digest('v0=' + self._zoom_webhook_sign(secret, message), signature):
+                return room, secret
+        _logger.warning("Zoom webhook rejected: signature does not match any secret token")
+        return None
+
     def action_test_connection(self):
         """Test API connection for configured provider"""
         self.ensure_one()
@@ -47,7 +211,7 @@ class VirtualRoom(models.Model):
                 
             url = f"https://zoom.us/oauth/token?grant_type=account_credentials&account_id={self.zoom_account_id}"
             try:
-                res = requests.post(url, auth=HTTPBasicAuth(self.zoom_client_id, self.zoom_client_secret), timeout=10)
+                res = http_client.post('zoom', url, auth=HTTPBasicAuth(self.zoom_client_id, self.zoom_client_secret))
                 res.raise_for_status()  # Raise exception for non-200 status
                 token = res.json().get('access_token')
                 return {
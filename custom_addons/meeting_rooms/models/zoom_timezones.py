@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+Zoom Timezones - resolution of any timezone to a Zoom-supported one.
+
+Zoom only accepts a subset of the Olson names. The resolution table is
+built once at module load for every pytz zone: it maps (tz_name, utc
+offset) to the ordered "safe" zones able to show that offset. A lookup
+takes the offset of the user's zone at the meeting's own date (not
+today's), so meetings on the other side of a DST change resolve to a
+zone with the right offset on that day.
+"""
+from bisect import bisect_right
+from datetime import datetime, timedelta
+import logging
+import pytz
+
+from . import tz_service
+
+_logger = logging.getLogger(__name__)
+
+# Special regions mapped by hand (Zoom rejects or mislabels these names)
+MANUAL_MAPPING = {
+    'Asia/Makassar': 'Asia/Singapore',
+    'Asia/Ujung_Pandang': 'Asia/Singapore',
+    'Asia/Jakarta': 'Asia/Bangkok',
+    'Asia/Pontianak': 'Asia/Bangkok',
+    'Asia/Jayapura': 'Asia/Tokyo',
+}
+
+# "Safe major cities" definitely supported by Zoom, in order of preference
+SAFE_ZONES = (
+    'UTC',
+    'Asia/Singapore', 'Asia/Bangkok', 'Asia/Tokyo', 'Asia/Seoul', 'Asia/Dubai', 'Asia/Kolkata',
+    'Europe/London', 'Europe/Paris', 'Europe/Berlin', 'Europe/Moscow',
+    'America/New_York', 'America/Chicago', 'America/Denver', 'America/Los_Angeles', 'America/Sao_Paulo',
+    'Australia/Sydney', 'Pacific/Auckland',
+)
+
+# Offsets used before this year are ignored (historical LMT/war time rules)
+TABLE_FROM_YEAR = 1990
+
+
+def _zone_offsets(tz_name):
+    """Distinct UTC offsets a zone uses since TABLE_FROM_YEAR."""
+    tz = pytz.timezone(tz_name)
+    transitions = getattr(tz, '_utc_transition_times', None)
+    if not transitions:
+        return {tz.utcoffset(None) or timedelta(0)}
+    # The rule in effect at the start of the period, and every later one
+    first = max(bisect_right(transitions, datetime(TABLE_FROM_YEAR, 1, 1)) - 1, 0)
+    return {info[0] for info in tz._transition_info[first:]}
+
+
+def _build_table():
+    safe_by_offset = {}
+    for safe_name in SAFE_ZONES:
+        for offset in _zone_offsets(safe_name):
+            safe_by_offset.setdefault(offset, []).append(safe_name)
+
+    table = {}
+    for tz_name in pytz.all_timezones:
+        try:
+            offsets = _zone_offsets(tz_name)
+        except pytz.UnknownTimeZoneError:
+            continue
+        for offset in offsets:
+            if tz_name in MANUAL_MAPPING:
+                candidates = (MANUAL_MAPPING[tz_name],)
+            elif tz_name in SAFE_ZONES:
+                candidates = (tz_name,)
+            else:
+                candidates = tuple(safe_by_offset.get(offset, ()))
+            table[(tz_name, offset)] = candidates
+    return table
+
+
+# (tz_name, utc offset) -> candidate Zoom zones, for every pytz zone
+RESOLUTION_TABLE = _build_table()
+
+
+def resolve(tz_name, utc_dt):
+    """
+    Zoom-supported timezone showing the same local time as tz_name at utc_dt.
+
+    Args:
+        tz_name: Olson timezone name (empty means UTC)
+        utc_dt: Naive UTC datetime of the meeting start
+
+    Returns:
+        Zoom-supported timezone name ('UTC' when nothing matches)
+    """
+    tz_name = tz_name or 'UTC'
+    if tz_name in MANUAL_MAPPING:
+        return MANUAL_MAPPING[tz_name]
+    try:
+        offset = tz_service.to_local(utc_dt, tz_name).utcoffset()
+    except pytz.UnknownTimeZoneError:
+        _logger.warning("ZOOM TZ: Unknown timezone %s, defaulting to UTC", tz_name)
+        return 'UTC'
+    for candidate in RESOLUTION_TABLE.get((tz_name, offset), ()):
+        # The safe zone must show the same offset on the meeting date too
+        if tz_service.to_local(utc_dt, candidate).utcoffset() == offset:
+            return candidate
+    _logger.warning("ZOOM TZ: No match found for %s at %s, defaulting to UTC", tz_name, utc_dt)
+    return 'UTC'
+
+
+def resolve_many(pairs):
+    """
+    Batch variant of resolve().
+
+    Args:
+        pairs: Iterable of (tz_name, utc_dt)
+
+    Returns:
+        Dict (tz_name, utc_dt) -> Zoom-supported timezone name
+    """
+    return {pair: resolve(*pair) for pair in set(pairs)}
+
+
+def resolve_series(tz_name, utc_dts):
+    """
+    Zoom-supported timezone for a recurring meeting.
+
+    Zoom expands the recurrence in the meeting's timezone, so the zone must
+    show the same offset as tz_name at every occurrence, not only the first
+    (a zone without DST cannot stand for one with DST across a change).
+
+    Args:
+        tz_name: Olson timezone name the series repeats in
+        utc_dts: Naive UTC starts of the occurrences (first one first)
+
+    Returns:
+        Zoom-supported timezone name
+    """
+    tz_name = tz_name or 'UTC'
+    utc_dts = list(utc_dts)
+    if not utc_dts or tz_name in MANUAL_MAPPING:
+        return resolve(tz_name, utc_dts[0] if utc_dts else datetime.utcnow())
+    try:
+        offsets = [tz_service.to_local(utc_dt, tz_name).utcoffset() for utc_dt in utc_dts]
+    except pytz.UnknownTimeZoneError:
+        _logger.warning("ZOOM TZ: Unknown timezone %s, defaulting to UTC", tz_name)
+        return 'UTC'
+    for candidate in RESOLUTION_TABLE.get((tz_name, offsets[0]), ()):
+        if all(tz_service.to_local(utc_dt, candidate).utcoffset() == offset
+               for utc_dt, offset in zip(utc_dts, offsets)):
+            return candidate
+    _logger.warning("ZOOM TZ: No zone matches %s over the whole series, using the first occurrence", tz_name)
+    return resolve(tz_name, utc_dts[0])
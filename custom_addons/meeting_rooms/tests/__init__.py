@@ -0,0 +1,6 @@
+# -*- coding: utf-8 -*-
+from . import test_indexes
+from . import test_availability
+from . import test_ics_builder
+from . import test_zoom_timezones
+from . import test_recurrence
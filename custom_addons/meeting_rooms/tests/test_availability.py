@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+from datetime import date, datetime, timedelta
+
+import pytz
+
+from odoo.tests.common import BaseCase
+
+from odoo.addons.meeting_rooms.models.availability import BusyIndex, ScheduleTemplate, free_slots, merge_intervals
+
+NEW_YORK = pytz.timezone('America/New_York')
+JAKARTA = pytz.timezone('Asia/Jakarta')
+
+# Every day, 00:00-24:00, so DST transition hours are part of the grid
+ALL_DAY = {weekday: ((0, 24 * 60),) for weekday in range(7)}
+
+
+class TestBusyIndex(BaseCase):
+
+    def test_merge_intervals(self):
+        d = datetime(2024, 1, 1)
+        h = lambda hours: d + timedelta(hours=hours)
+        self.assertEqual(merge_intervals([
+            (h(5), h(6)), (h(1), h(3)), (h(2), h(4)),  # overlapping
+            (h(6), h(7)),                              # touching
+            (h(9), h(9)), (h(11), h(10)),              # empty / negative
+            (None, h(12)),
+        ]), [(h(1), h(4)), (h(5), h(7))])
+
+    def test_overlaps_boundaries(self):
+        d = datetime(2024, 1, 1)
+        busy = BusyIndex([(d.replace(hour=10), d.replace(hour=11)), (d.replace(hour=14), d.replace(hour=15))])
+        self.assertEqual(len(busy), 2)
+        self.assertTrue(busy.overlaps(d.replace(hour=10, minute=30), d.replace(hour=10, minute=45)))
+        self.assertTrue(busy.overlaps(d.replace(hour=9), d.replace(hour=16)))
+        # Half-open intervals: touching is not overlapping
+        self.assertFalse(busy.overlaps(d.replace(hour=9), d.replace(hour=10)))
+        self.assertFalse(busy.overlaps(d.replace(hour=11), d.replace(hour=14)))
+        self.assertTrue(busy.is_free(d.replace(hour=15), d.replace(hour=16)))
+        self.assertFalse(BusyIndex())
+        self.assertFalse(BusyIndex().overlaps(d, d.replace(hour=23)))
+
+    def test_padding(self):
+        d = datetime(2024, 1, 1)
+        busy = BusyIndex([(d.replace(hour=10), d.replace(hour=11))], padding=timedelta(minutes=15))
+        self.assertTrue(busy.overlaps(d.replace(hour=9), d.replace(hour=9, minute=50)))
+        self.assertTrue(busy.overlaps(d.replace(hour=11, minute=10), d.replace(hour=12)))
+        self.assertFalse(busy.overlaps(d.replace(hour=11, minute=15), d.replace(hour=12)))
+
+
+class TestScheduleTemplate(BaseCase):
+
+    def test_grid(self):
+        template = ScheduleTemplate({0: ((9 * 60, 12 * 60), (13 * 60, 14 * 60 + 30))}, slot_minutes=45)
+        monday, tuesday = datetime(2024, 1, 1), datetime(2024, 1, 2)
+        self.assertEqual([int(offset.total_seconds() // 60) for offset in template.offsets[0]],
+                         [9 * 60, 9 * 60 + 45, 10 * 60 + 30, 11 * 60 + 15, 13 * 60, 13 * 60 + 45])
+        self.assertEqual(template.offsets[1], ())
+        self.assertTrue(template.is_slot_start(monday.replace(hour=10, minute=30)))
+        self.assertFalse(template.is_slot_start(monday.replace(hour=10, minute=30, second=1)))
+        self.assertFalse(template.is_slot_start(monday.replace(hour=12)))
+        self.assertFalse(template.is_slot_start(tuesday.replace(hour=9)))
+        self.assertEqual(template.count_passed(monday.replace(hour=10, minute=30)), 2)
+        self.assertEqual(template.count_passed(monday.replace(hour=10, minute=30, second=1)), 3)
+        self.assertEqual(template.count_passed(monday.replace(hour=23)), 6)
+
+    def test_fingerprint(self):
+        self.assertEqual(ScheduleTemplate().fingerprint, ScheduleTemplate().fingerprint)
+        self.assertNotEqual(ScheduleTemplate().fingerprint, ScheduleTemplate(slot_minutes=30).fingerprint)
+        self.assertNotEqual(ScheduleTemplate().fingerprint, ScheduleTemplate(buffer_minutes=10).fingerprint)
+
+    def _slow_day(self, template, local_date, tz):
+        """Reference implementation: localize every slot."""
+        result = []
+        for offset in template.offsets[local_date.weekday()]:
+            naive = datetime.combine(local_date, datetime.min.time()) + offset
+            local = tz.normalize(tz.localize(naive))
+            if local.replace(tzinfo=None) == naive:
+                start = local.astimezone(pytz.utc).replace(tzinfo=None)
+                result.append((naive, start, start + template.slot_delta))
+        return result
+
+    def test_fast_path_matches_localize(self):
+        template = ScheduleTemplate(ALL_DAY, slot_minutes=30)
+        for tz in (JAKARTA, NEW_YORK):
+            for day in range(-3, 4):
+                for transition in (date(2024, 3, 10), date(2024, 11, 3)):
+                    local_date = transition + timedelta(days=day)
+                    self.assertEqual(list(template.iter_day(local_date, tz)),
+                                     self._slow_day(template, local_date, tz), "%s %s" % (tz, local_date))
+
+    def test_spring_forward_day(self):
+        slots = list(ScheduleTemplate(ALL_DAY).iter_day(date(2024, 3, 10), NEW_YORK))
+        # 02:00 local does not exist that day
+        self.assertEqual([naive.hour for naive, _start, _end in slots], [0, 1] + list(range(3, 24)))
+        self.assertEqual(slots[1][1], datetime(2024, 3, 10, 6))   # 01:00 EST
+        self.assertEqual(slots[2][1], datetime(2024, 3, 10, 7))   # 03:00 EDT
+
+    def test_fall_back_day(self):
+        slots = list(ScheduleTemplate(ALL_DAY).iter_day(date(2024, 11, 3), NEW_YORK))
+        self.assertEqual(len(slots), 24)
+        self.assertEqual(slots[0][1], datetime(2024, 11, 3, 4))   # 00:00 EDT
+        self.assertEqual(slots[2][1], datetime(2024, 11, 3, 7))   # 02:00 EST
+        # Ambiguous 01:00 resolves to standard time, like pytz' default
+        self.assertEqual(slots[1][1], datetime(2024, 11, 3, 6))
+
+
+class TestFreeSlots(BaseCase):
+
+    def test_busy_and_window(self):
+        template = ScheduleTemplate(slot_minutes=60)
+        window_start, window_end = datetime(2024, 1, 1, 3, 30), datetime(2024, 1, 1, 9)
+        busy = BusyIndex([(datetime(2024, 1, 1, 4, 30), datetime(2024, 1, 1, 5))])
+        days = free_slots(busy, JAKARTA, window_start, window_end, template)
+        # Jakarta is UTC+7: the window is 10:30-16:00 local, the meeting 11:30-12:00
+        self.assertEqual(len(days), 1)
+        self.assertEqual(days[0][0], date(2024, 1, 1))
+        self.assertEqual([naive.hour for naive, _start, _end in days[0][1]], [12, 13, 14, 15])
+
+    def test_buffer(self):
+        template = ScheduleTemplate(slot_minutes=60, buffer_minutes=30)
+        day = datetime(2024, 1, 1)
+        busy = [(datetime(2024, 1, 1, 4), datetime(2024, 1, 1, 5))]
+        slots = free_slots(busy, JAKARTA, day, day + timedelta(days=1), template)[0][1]
+        # 11:00 (busy) and the neighbouring 10:00/12:00 slots are blocked by the buffer
+        self.assertEqual([naive.hour for naive, _start, _end in slots], [9, 13, 14, 15, 16])
+
+    def test_dst_week(self):
+        template = ScheduleTemplate(slot_minutes=60)
+        window_start, window_end = datetime(2024, 3, 8, 5), datetime(2024, 3, 15, 4)
+        days = free_slots(BusyIndex(), NEW_YORK, window_start, window_end, template)
+        self.assertEqual([day for day, _slots in days], [date(2024, 3, 8) + timedelta(days=i) for i in range(7)])
+        for day, slots in days:
+            # Local wall time stays 09:00-16:00 on both sides of the change
+            self.assertEqual([naive.hour for naive, _start, _end in slots], list(range(9, 17)))
+            offset = 4 if day >= date(2024, 3, 10) else 5
+            self.assertEqual(slots[0][1], datetime.combine(day, datetime.min.time()) + timedelta(hours=9 + offset))
+
+    def test_busy_across_transition(self):
+        template = ScheduleTemplate(ALL_DAY, slot_minutes=60)
+        # 01:00 EST - 03:00 EDT is one hour of real time
+        busy = BusyIndex([(datetime(2024, 3, 10, 6), datetime(2024, 3, 10, 7))])
+        slots = free_slots(busy, NEW_YORK, datetime(2024, 3, 10, 5), datetime(2024, 3, 11, 4), template)[0][1]
+        hours = [naive.hour for naive, _start, _end in slots]
+        self.assertNotIn(1, hours)
+        self.assertNotIn(2, hours)
+        self.assertIn(3, hours)
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+from datetime import datetime, timedelta
+
+from odoo.tests.common import BaseCase
+
+from odoo.addons.meeting_rooms.models import recurrence
+from odoo.addons.meeting_rooms.models.ics_builder import (
+    ICSCalendar, escape_text, fold_line, format_offset, tz_observances, vtimezone_lines, yearly_rule,
+)
+
+
+def unfold(ics):
+    return ics.replace('\r\n ', '')
+
+
+def components(lines, kind):
+    """Property dicts of every `kind` component (e.g. DAYLIGHT) in a list of lines."""
+    found, current = [], None
+    for line in lines:
+        if line == 'BEGIN:%s' % kind:
+            current = {}
+        elif line == 'END:%s' % kind:
+            found.append(current)
+            current = None
+        elif current is not None:
+            name, value = line.split(':', 1)
+            current[name] = value
+    return found
+
+
+class TestFormatting(BaseCase):
+
+    def test_escape_text(self):
+        self.assertEqual(escape_text('a;b,c\\d\r\ne\nf'), 'a\\;b\\,c\\\\d\\ne\\nf')
+        self.assertEqual(escape_text(None), '')
+
+    def test_fold_ascii(self):
+        line = 'DESCRIPTION:' + 'x' * 200
+        folded = fold_line(line)
+        parts = folded.split('\r\n')
+        self.assertEqual(len(parts[0].encode()), 75)
+        self.assertTrue(all(part.startswith(' ') and len(part.encode()) <= 75 for part in parts[1:]))
+        self.assertEqual(unfold(folded), line)
+        self.assertEqual(fold_line('SUMMARY:short'), 'SUMMARY:short')
+
+    def test_fold_utf8(self):
+        # 3-octet characters never straddle a fold
+        line = 'SUMMARY:' + '会議' * 40
+        folded = fold_line(line)
+        for part in folded.split('\r\n'):
+            self.assertLessEqual(len(part.encode('utf-8')), 75)
+            part.encode('utf-8').decode('utf-8')
+        self.assertEqual(unfold(folded), line)
+
+    def test_format_offset(self):
+        self.assertEqual(format_offset(timedelta(hours=7)), '+0700')
+        self.assertEqual(format_offset(timedelta(hours=-3, minutes=-30)), '-0330')
+        self.assertEqual(format_offset(timedelta(hours=5, minutes=17, seconds=36)), '+051736')
+        self.assertEqual(format_offset(timedelta(0)), '+0000')
+
+
+class TestVTimezone(BaseCase):
+
+    def test_fixed_offset_zone(self):
+        lines = vtimezone_lines('Asia/Jakarta', [2024])
+        self.assertEqual(components(lines, 'DAYLIGHT'), [])
+        standard = components(lines, 'STANDARD')
+        self.assertEqual(standard[-1]['TZOFFSETTO'], '+0700')
+
+    def test_dst_zone_year(self):
+        observances = tz_observances('America/New_York', 2024)
+        self.assertEqual([obs[0] for obs in observances], ['STANDARD', 'DAYLIGHT', 'STANDARD'])
+        # DTSTART is the local time before each transition
+        self.assertEqual(observances[1][1], datetime(2024, 3, 10, 2))
+        self.assertEqual(observances[2][1], datetime(2024, 11, 3, 2))
+        lines = vtimezone_lines('America/New_York', [2024])
+        daylight = components(lines, 'DAYLIGHT')
+        self.assertEqual(daylight, [{
+            'DTSTART': '20240310T020000', 'TZOFFSETFROM': '-0500', 'TZOFFSETTO': '-0400', 'TZNAME': 'EDT',
+        }])
+        self.assertNotIn('RRULE', ''.join(lines))
+
+    def test_southern_hemisphere(self):
+        kinds = [(obs[0], obs[1].month) for obs in tz_observances('Australia/Sydney', 2024)]
+        self.assertEqual(kinds, [('DAYLIGHT', 10), ('STANDARD', 4), ('DAYLIGHT', 10)])
+
+    def test_event_spanning_years(self):
+        cal = ICSCalendar()
+        cal.add_event('u@x', datetime(2024, 12, 31, 22), datetime(2025, 1, 1, 1), tzid='Europe/Paris')
+        daylight = components(unfold(cal.to_string()).split('\r\n'), 'DAYLIGHT')
+        self.assertEqual([obs['DTSTART'][:4] for obs in daylight], ['2024', '2025'])
+
+    def test_yearly_rule(self):
+        self.assertEqual(yearly_rule(datetime(2037, 3, 8, 2)), 'FREQ=YEARLY;BYMONTH=3;BYDAY=2SU')
+        self.assertEqual(yearly_rule(datetime(2037, 11, 1, 2)), 'FREQ=YEARLY;BYMONTH=11;BYDAY=1SU')
+        self.assertEqual(yearly_rule(datetime(2037, 10, 25, 3)), 'FREQ=YEARLY;BYMONTH=10;BYDAY=-1SU')
+        # 4th Sunday that also is the last one of the month
+        self.assertEqual(yearly_rule(datetime(2024, 2, 25)), 'FREQ=YEARLY;BYMONTH=2;BYDAY=-1SU')
+
+    def test_open_ended_series(self):
+        start, end = datetime(2024, 1, 3, 14), datetime(2024, 1, 3, 15)
+        tz_name = 'America/New_York'
+        cal = ICSCalendar()
+        cal.add_event('u@x', start, end, tzid=tz_name,
+                      rrule=recurrence.rrule_string('weekly', None, tz_name),
+                      series_last_start=recurrence.last_start(start, 'weekly', None, tz_name))
+        lines = unfold(cal.to_string()).split('\r\n')
+        self.assertIn('RRULE:FREQ=WEEKLY;COUNT=%d' % recurrence.MAX_OCCURRENCES, lines)
+        daylight = components(lines, 'DAYLIGHT')
+        standard = components(lines, 'STANDARD')
+        # Explicit observances up to the end of the pytz table, then yearly rules
+        self.assertEqual(daylight[-1]['RRULE'], 'FREQ=YEARLY;BYMONTH=3;BYDAY=2SU')
+        self.assertEqual(standard[-1]['RRULE'], 'FREQ=YEARLY;BYMONTH=11;BYDAY=1SU')
+        self.assertEqual(daylight[-1]['DTSTART'][:4], standard[-1]['DTSTART'][:4])
+        self.assertEqual(sum('RRULE' in obs for obs in daylight + standard), 2)
+
+    def test_no_rule_without_dst(self):
+        start = datetime(2024, 1, 3, 2)
+        cal = ICSCalendar()
+        cal.add_event('u@x', start, start + timedelta(hours=1), tzid='Asia/Jakarta',
+                      rrule=recurrence.rrule_string('daily', None, 'Asia/Jakarta'),
+                      series_last_start=recurrence.last_start(start, 'daily', None, 'Asia/Jakarta'))
+        self.assertEqual(unfold(cal.to_string()).count('RRULE:'), 1)
+
+
+class TestCalendar(BaseCase):
+
+    def test_event(self):
+        cal = ICSCalendar(method='REQUEST', name='Team; Room')
+        cal.add_event(
+            'meeting_event_1@db', datetime(2024, 3, 8, 14), datetime(2024, 3, 8, 15), tzid='America/New_York',
+            summary='Sync, weekly', description='Line 1\nLine 2', organizer=('Host', 'host@example.com'),
+            attendees=[('Guest', 'guest@example.com'), ('No mail', False)], alarm_minutes=15, sequence=3,
+            rrule=recurrence.rrule_string('weekly', datetime(2024, 3, 29).date(), 'America/New_York'),
+            exdates=[datetime(2024, 3, 15, 13)], dtstamp=datetime(2024, 1, 1),
+        )
+        ics = cal.to_string()
+        self.assertTrue(ics.endswith('END:VCALENDAR\r\n'))
+        self.assertNotIn('\n', ics.replace('\r\n', ''))
+        lines = unfold(ics).split('\r\n')
+        self.assertIn('X-WR-CALNAME:Team\\; Room', lines)
+        self.assertIn('DTSTART;TZID=America/New_York:20240308T090000', lines)
+        # The excluded occurrence is after the DST change: same wall time
+        self.assertIn('EXDATE;TZID=America/New_York:20240315T090000', lines)
+        self.assertIn('RRULE:FREQ=WEEKLY;UNTIL=20240330T035959Z', lines)
+        self.assertIn('SUMMARY:Sync\\, weekly', lines)
+        self.assertIn('DESCRIPTION:Line 1\\nLine 2', lines)
+        self.assertIn('TRIGGER:-PT15M', lines)
+        self.assertEqual(sum(line.startswith('ATTENDEE') for line in lines), 1)
+        # One VTIMEZONE per zone, with both observances of the series
+        self.assertEqual(lines.count('BEGIN:VTIMEZONE'), 1)
+        self.assertEqual(len(components(lines, 'DAYLIGHT')), 1)
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+from odoo.tests.common import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestMeetingIndexes(TransactionCase):
+    """Check that the indexes created by init() exist and are picked by the planner."""
+
+    def _explain(self, query, params=()):
+        # Test tables are tiny: forbid sequential scans so the plan shows
+        # whether a usable index exists at all.
+        self.env.cr.execute("SET LOCAL enable_seqscan = off")
+        self.env.cr.execute("EXPLAIN " + query, params)
+        return "\n".join(row[0] for row in self.env.cr.fetchall())
+
+    def _drop_competing_indexes(self, table, indexname):
+        """
+        Drop (rolled back) the other indexes of table that no constraint relies on.
+
+        ORM and core indexes (e.g. mail_activity.res_model, the m2m column
+        indexes) also match the tested queries, so the plan only proves that
+        indexname is usable once they are out of the way.
+        """
+        self.env.cr.execute("""
+            SELECT ci.relname
+              FROM pg_index i
+              JOIN pg_class ci ON ci.oid = i.indexrelid
+              JOIN pg_class ct ON ct.oid = i.indrelid
+             WHERE ct.relname = %s AND ci.relname != %s
+               AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid)
+        """, (table, indexname))
+        for (name,) in self.env.cr.fetchall():
+            self.env.cr.execute('DROP INDEX "%s"' % name)
+
+    def _assertIndexUsed(self, indexname, plan):
+        """The index exists and the plan reads through it."""
+        self.env.cr.execute("SELECT 1 FROM pg_indexes WHERE indexname = %s", (indexname,))
+        self.assertTrue(self.env.cr.fetchone(), "index %s is missing" % indexname)
+        self.assertIn(indexname, plan)
+
+    def test_event_state_dates_index(self):
+        plan = self._explain("""
+            SELECT id FROM meeting_event
+             WHERE state = 'draft' AND start_date < now() AND end_date > now() - interval '1 day'
+        """)
+        self.assertIn('meeting_event_state_dates_idx', plan)
+
+    def test_event_confirmed_partial_index(self):
+        # The full (state, dates) index also matches this query; drop it for
+        # this test only (rolled back) so the plan proves the partial index is
+        # usable on its own and not merely present.
+        self.env.cr.execute("DROP INDEX IF EXISTS meeting_event_state_dates_idx")
+        plan = self._explain("""
+            SELECT id FROM meeting_event
+             WHERE state = 'confirm' AND start_date < now() AND end_date > now() - interval '1 day'
+        """)
+        self.assertIn('meeting_event_confirmed_dates_idx', plan)
+
+    def test_attendee_relation_index(self):
+        attendee = self.env['meeting.event']._fields['attendee']
+        self._drop_competing_indexes(attendee.relation, '%s_user_event_idx' % attendee.relation)
+        plan = self._explain("SELECT {} FROM {} WHERE {} = %s".format(
+            attendee.column1, attendee.relation, attendee.column2), (self.env.uid,))
+        self._assertIndexUsed('%s_user_event_idx' % attendee.relation, plan)
+
+    def test_activity_cleanup_index(self):
+        self._drop_competing_indexes('mail_activity', 'mail_activity_res_model_deadline_idx')
+        plan = self._explain("""
+            SELECT id FROM mail_activity
+             WHERE res_model = 'meeting.event' AND date_deadline < current_date
+        """)
+        self._assertIndexUsed('mail_activity_res_model_deadline_idx', plan)
+
+    def test_room_location_index(self):
+        plan = self._explain("""
+            SELECT id FROM meeting_rooms
+             WHERE room_location = 1 AND start_date < now() AND end_date > now() - interval '1 day'
+        """)
+        self.assertIn('meeting_rooms_location_dates_idx', plan)
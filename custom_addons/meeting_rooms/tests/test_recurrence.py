@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+from datetime import date, datetime, timedelta
+import random
+
+from odoo.tests.common import BaseCase
+
+from odoo.addons.meeting_rooms.models import recurrence
+
+# Weekly 09:00-10:00 in New York, first occurrence before the 2024-03-10 change (EST)
+START = datetime(2024, 2, 26, 14)
+END = datetime(2024, 2, 26, 15)
+NEW_YORK = 'America/New_York'
+
+
+def starts(*args, **kwargs):
+    return [start for start, _end in recurrence.iter_occurrences(*args, **kwargs)]
+
+
+class TestOccurrences(BaseCase):
+
+    def test_single(self):
+        self.assertEqual(list(recurrence.iter_occurrences(START, END, False, None)), [(START, END)])
+        self.assertEqual(list(recurrence.iter_occurrences(START, END, False, None, window_start=END)), [])
+        self.assertEqual(list(recurrence.iter_occurrences(START, END, False, None, window_end=START)), [])
+        self.assertEqual(list(recurrence.iter_occurrences(False, END, 'weekly', None)), [])
+
+    def test_dst_keeps_wall_time(self):
+        occurrences = starts(START, END, 'weekly', date(2024, 3, 18), NEW_YORK)
+        self.assertEqual(occurrences, [
+            datetime(2024, 2, 26, 14), datetime(2024, 3, 4, 14),
+            datetime(2024, 3, 11, 13), datetime(2024, 3, 18, 13),  # 09:00 EDT
+        ])
+        # Fall back: 09:00 EDT then 09:00 EST
+        fall = starts(datetime(2024, 10, 28, 13), datetime(2024, 10, 28, 14), 'weekly', date(2024, 11, 4), NEW_YORK)
+        self.assertEqual(fall, [datetime(2024, 10, 28, 13), datetime(2024, 11, 4, 14)])
+
+    def test_daily_across_transition_day(self):
+        # 02:30 local does not exist on 2024-03-10: that occurrence keeps the
+        # EST offset (pytz default), none is lost or duplicated
+        occurrences = starts(datetime(2024, 3, 9, 7, 30), datetime(2024, 3, 9, 8), 'daily', date(2024, 3, 11), NEW_YORK)
+        self.assertEqual(occurrences, [datetime(2024, 3, 9, 7, 30), datetime(2024, 3, 10, 7, 30), datetime(2024, 3, 11, 6, 30)])
+        self.assertEqual(len(set(occurrences)), 3)
+
+    def test_final_date_is_local_and_inclusive(self):
+        # 20:00 in New York is already the next day in UTC
+        first = datetime(2024, 1, 2, 1)
+        occurrences = starts(first, first + timedelta(hours=1), 'daily', date(2024, 1, 3), NEW_YORK)
+        self.assertEqual(occurrences, [datetime(2024, 1, 2, 1), datetime(2024, 1, 3, 1), datetime(2024, 1, 4, 1)])
+        self.assertEqual(starts(START, END, 'weekly', START.date() - timedelta(days=1), NEW_YORK), [])
+
+    def test_max_occurrences(self):
+        self.assertEqual(len(starts(START, END, 'daily', None, 'UTC')), recurrence.MAX_OCCURRENCES)
+
+    def test_window_seek(self):
+        window = (datetime(2031, 6, 1), datetime(2031, 7, 1))
+        occurrences = starts(START, END, 'weekly', None, NEW_YORK, *window)
+        self.assertEqual(len(occurrences), 5)  # Mondays of June 2031
+        self.assertTrue(all(start.hour == 13 for start in occurrences))  # 09:00 EDT
+        # Same result as a full walk
+        self.assertEqual(occurrences, [start for start in starts(START, END, 'weekly', None, NEW_YORK)
+                                       if window[0] < start + (END - START) and start < window[1]])
+
+    def test_window_seek_random(self):
+        rng = random.Random(42)
+        full = list(recurrence.iter_occurrences(START, END, 'daily', date(2030, 1, 1), NEW_YORK))
+        for _i in range(200):
+            window_start = START + timedelta(hours=rng.randint(-48, 24 * 365 * 6))
+            window_end = window_start + timedelta(hours=rng.randint(1, 24 * 20))
+            expected = [occ for occ in full if occ[1] > window_start and occ[0] < window_end]
+            self.assertEqual(list(recurrence.iter_occurrences(
+                START, END, 'daily', date(2030, 1, 1), NEW_YORK, window_start, window_end)), expected)
+
+    def test_window_boundaries(self):
+        # An occurrence ending exactly at window_start is excluded, one starting at window_end too
+        second, third = datetime(2024, 3, 4, 14), datetime(2024, 3, 11, 13)
+        self.assertEqual(starts(START, END, 'weekly', None, NEW_YORK, second + timedelta(hours=1), third), [])
+        self.assertEqual(starts(START, END, 'weekly', None, NEW_YORK, second, second + timedelta(minutes=1)), [second])
+
+
+class TestExceptions(BaseCase):
+
+    def test_cancel_and_move(self):
+        cancelled = datetime(2024, 3, 4, 14)
+        moved = datetime(2024, 3, 11, 13)
+        exceptions = {
+            cancelled: None,
+            moved: (datetime(2024, 3, 20, 16), datetime(2024, 3, 20, 17)),
+        }
+        series = list(recurrence.iter_series(START, END, 'weekly', date(2024, 3, 25), NEW_YORK, exceptions=exceptions))
+        self.assertEqual(series, [
+            (START, START, END),
+            (datetime(2024, 3, 18, 13), datetime(2024, 3, 18, 13), datetime(2024, 3, 18, 14)),
+            (moved, datetime(2024, 3, 20, 16), datetime(2024, 3, 20, 17)),
+            (datetime(2024, 3, 25, 13), datetime(2024, 3, 25, 13), datetime(2024, 3, 25, 14)),
+        ])
+
+    def test_moved_into_window(self):
+        # Moved from far outside the window, into it
+        exceptions = {datetime(2024, 6, 3, 13): (datetime(2025, 1, 1, 16), datetime(2025, 1, 1, 17))}
+        window = (datetime(2025, 1, 1), datetime(2025, 1, 2))
+        self.assertEqual(list(recurrence.iter_series(START, END, 'weekly', date(2024, 12, 31), NEW_YORK,
+                                                     *window, exceptions=exceptions)),
+                         [(datetime(2024, 6, 3, 13), datetime(2025, 1, 1, 16), datetime(2025, 1, 1, 17))])
+        # and out of it
+        window = (datetime(2024, 6, 3), datetime(2024, 6, 4))
+        self.assertEqual(list(recurrence.iter_series(START, END, 'weekly', None, NEW_YORK,
+                                                     *window, exceptions=exceptions)), [])
+
+
+class TestRules(BaseCase):
+
+    def test_last_start(self):
+        self.assertEqual(recurrence.last_start(START, 'weekly', date(2024, 3, 20), NEW_YORK), datetime(2024, 3, 18, 13))
+        self.assertEqual(recurrence.last_start(START, 'weekly', date(2024, 1, 1), NEW_YORK), START)
+        # Open-ended: the last occurrence iter_occurrences() generates
+        self.assertEqual(recurrence.last_start(START, 'daily', None, 'UTC'),
+                         START + timedelta(days=recurrence.MAX_OCCURRENCES - 1))
+        self.assertEqual(recurrence.last_start(START, 'weekly', None, NEW_YORK),
+                         starts(START, END, 'weekly', None, NEW_YORK)[-1])
+
+    def test_rrule_string(self):
+        self.assertIsNone(recurrence.rrule_string(False, None))
+        self.assertEqual(recurrence.rrule_string('daily', None), 'FREQ=DAILY;COUNT=%d' % recurrence.MAX_OCCURRENCES)
+        # UNTIL is the end of final_date in the series timezone, in UTC
+        self.assertEqual(recurrence.rrule_string('weekly', date(2024, 3, 18), NEW_YORK), 'FREQ=WEEKLY;UNTIL=20240319T035959Z')
+        self.assertEqual(recurrence.rrule_string('weekly', date(2024, 1, 31), 'Asia/Jakarta'), 'FREQ=WEEKLY;UNTIL=20240131T165959Z')
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+from datetime import datetime, timedelta
+
+from odoo.tests.common import BaseCase
+
+from odoo.addons.meeting_rooms.models import zoom_timezones
+
+WINTER = datetime(2024, 1, 15, 15)
+SUMMER = datetime(2024, 7, 15, 15)
+
+
+class TestZoomTimezones(BaseCase):
+
+    def test_table(self):
+        table = zoom_timezones.RESOLUTION_TABLE
+        self.assertEqual(table[('Europe/Paris', timedelta(hours=1))], ('Europe/Paris',))
+        self.assertEqual(table[('Asia/Jakarta', timedelta(hours=7))], ('Asia/Bangkok',))
+        # Ordered like SAFE_ZONES: London in summer also shows +01:00
+        self.assertEqual(table[('Europe/Amsterdam', timedelta(hours=1))][:2], ('Europe/London', 'Europe/Paris'))
+
+    def test_manual_and_safe_zones(self):
+        self.assertEqual(zoom_timezones.resolve('Asia/Jakarta', WINTER), 'Asia/Bangkok')
+        self.assertEqual(zoom_timezones.resolve('Asia/Makassar', SUMMER), 'Asia/Singapore')
+        self.assertEqual(zoom_timezones.resolve('Asia/Kolkata', WINTER), 'Asia/Kolkata')
+        self.assertEqual(zoom_timezones.resolve('America/Chicago', SUMMER), 'America/Chicago')
+
+    def test_fallbacks(self):
+        self.assertEqual(zoom_timezones.resolve(False, WINTER), 'UTC')
+        self.assertEqual(zoom_timezones.resolve('Mars/Olympus_Mons', WINTER), 'UTC')
+        # +05:45, no supported zone shows it
+        self.assertEqual(zoom_timezones.resolve('Asia/Kathmandu', WINTER), 'UTC')
+
+    def test_offset_of_the_meeting_date(self):
+        # London shows +01:00 in summer only
+        self.assertEqual(zoom_timezones.resolve('Europe/Amsterdam', WINTER), 'Europe/Paris')
+        self.assertEqual(zoom_timezones.resolve('Europe/Amsterdam', SUMMER), 'Europe/Paris')
+        self.assertEqual(zoom_timezones.resolve('America/Toronto', WINTER), 'America/New_York')
+        self.assertEqual(zoom_timezones.resolve('America/Toronto', SUMMER), 'America/New_York')
+        # No DST in Phoenix: -07:00 is Denver in winter but Los Angeles in summer
+        self.assertEqual(zoom_timezones.resolve('America/Phoenix', WINTER), 'America/Denver')
+        self.assertEqual(zoom_timezones.resolve('America/Phoenix', SUMMER), 'America/Los_Angeles')
+
+    def test_dst_transition_week(self):
+        # Last occurrence before and first after the European change (2024-03-31)
+        before, after = datetime(2024, 3, 30, 9), datetime(2024, 4, 1, 9)
+        self.assertEqual(zoom_timezones.resolve('Europe/London', before), 'Europe/London')
+        self.assertEqual(zoom_timezones.resolve('Europe/Lisbon', before), 'UTC')
+        self.assertEqual(zoom_timezones.resolve('Europe/Lisbon', after), 'Europe/London')
+
+    def test_resolve_many(self):
+        pairs = [('Asia/Jakarta', WINTER), ('America/Phoenix', SUMMER), ('Asia/Jakarta', WINTER)]
+        self.assertEqual(zoom_timezones.resolve_many(pairs), {
+            ('Asia/Jakarta', WINTER): 'Asia/Bangkok',
+            ('America/Phoenix', SUMMER): 'America/Los_Angeles',
+        })
+
+    def test_resolve_series(self):
+        weekly = [datetime(2024, 3, 1, 15) + timedelta(weeks=i) for i in range(8)]
+        # Same DST rules over the whole series
+        self.assertEqual(zoom_timezones.resolve_series('America/Toronto', weekly), 'America/New_York')
+        self.assertEqual(zoom_timezones.resolve_series('Europe/Amsterdam', weekly), 'Europe/Paris')
+        # Lisbon matches UTC before its change and London after, only London follows both
+        self.assertEqual(zoom_timezones.resolve_series('Europe/Lisbon', weekly), 'Europe/London')
+        # Nothing follows Phoenix across the US change: the first occurrence decides
+        self.assertEqual(zoom_timezones.resolve_series('America/Phoenix', weekly), 'America/Denver')
+        self.assertEqual(zoom_timezones.resolve_series('Asia/Jakarta', weekly), 'Asia/Bangkok')
+        self.assertEqual(zoom_timezones.resolve_series('UTC', []), 'UTC')
@@ -3,7 +3,7 @@
     'version': '1.0',
     'summary': 'Track Container Position via TimeToCargo API',
     'author': 'Taufik Hidayat',
-    'depends': ['stock', 'website', 'sale'],
+    'depends': ['stock', 'website', 'sale', 'outbound_http'],
     'data': [
         'security/ir.model.access.csv',
         'data/api_credentials.xml',
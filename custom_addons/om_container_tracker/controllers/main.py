@@ -1,6 +1,7 @@
 from odoo import http
 from odoo.http import request
 import requests
+from odoo.addons.outbound_http import http_client
 import json
 import hashlib
 import logging
@@ -17,7 +18,6 @@ class ContainerTrackingController(http.Controller):
     MAX_REQUESTS_PER_TOKEN = 5
     RATE_LIMIT_WINDOW = 3600  # 1 hour
     CONTAINER_FORMAT = r'^[A-Z]{4}[0-9]{6,7}$'  # Issue #4: Input validation (ISO 6346)
-    API_TIMEOUT = 30  # Issue #10: Optimized timeout
     MAX_EVENTS = 100  # Issue #9: Pagination
 
     def _safe_get(self, data, key, default=None):
@@ -166,8 +166,8 @@ class ContainerTrackingController(http.Controller):
         params = {"api_key": api_key, "company": "AUTO", "container_number": number.upper()}
 
         try:
-            response = requests.get(url, params=params, timeout=self.API_TIMEOUT,
-                                  headers={'User-Agent': 'Odoo-ContainerTracker/2.0'})
+            response = http_client.get('timetocargo', url, params=params,
+                                       headers={'User-Agent': 'Odoo-ContainerTracker/2.0'})
 
             if response.status_code != 200:
                 _logger.warning(f"API error {response.status_code}")
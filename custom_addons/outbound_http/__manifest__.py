@@ -0,0 +1,13 @@
+{
+    'name': 'Outbound HTTP Pool',
+    'version': '1.0',
+    'summary': 'Shared keep-alive HTTP sessions, retries and timeouts for external API calls',
+    'author': 'Taufik Hidayat',
+    'depends': ['base'],
+    'external_dependencies': {
+        'python': ['requests', 'urllib3'],
+    },
+    'data': [],
+    'installable': True,
+    'application': False,
+}
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+"""
+Shared outbound HTTP client for provider APIs.
+
+One requests.Session per provider and per process keeps TCP/TLS
+connections alive between calls (per-host urllib3 pools), retries
+connection failures and throttling responses with backoff, and applies
+the provider timeout budget. Usage:
+
+    from odoo.addons.outbound_http import http_client
+    res = http_client.post('zoom', url, headers=headers, json=payload)
+
+Exceptions are the usual requests.exceptions classes.
+"""
+import logging
+import os
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_logger = logging.getLogger(__name__)
+
+# (connect, read) timeout budget per provider, in seconds
+PROVIDER_TIMEOUTS = {
+    'zoom': (5, 20),
+    'teams': (5, 20),
+    'google': (5, 20),
+    'timetocargo': (5, 30),
+    'default': (5, 30),
+}
+
+# Keep-alive connections kept per host and per process
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 8
+
+# Connection errors are retried for every method (nothing was sent yet);
+# throttling/gateway statuses only for idempotent methods, so a meeting is
+# never created twice.
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.5
+RETRY_STATUSES = (429, 502, 503, 504)
+RETRY_METHODS = frozenset(['HEAD', 'GET', 'PUT', 'DELETE', 'OPTIONS'])
+
+_lock = threading.Lock()
+_sessions = {}
+_stats = {}
+
+
+def _make_retry():
+    kwargs = dict(
+        total=RETRY_TOTAL,
+        connect=RETRY_TOTAL,
+        read=0,
+        status=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUSES,
+        raise_on_status=False,
+    )
+    try:
+        return Retry(allowed_methods=RETRY_METHODS, **kwargs)
+    except TypeError:
+        # urllib3 < 1.26
+        return Retry(method_whitelist=RETRY_METHODS, **kwargs)
+
+
+def get_session(provider):
+    """
+    Return the keep-alive session of a provider, creating it on first use.
+
+    Sessions are rebuilt after a fork (prefork workers must not share sockets).
+    """
+    pid = os.getpid()
+    entry = _sessions.get(provider)
+    if entry and entry[0] == pid:
+        return entry[1]
+    with _lock:
+        entry = _sessions.get(provider)
+        if entry and entry[0] == pid:
+            return entry[1]
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=_make_retry())
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        _sessions[provider] = (pid, session)
+        _stats[provider] = {'requests': 0, 'errors': 0, 'elapsed': 0.0}
+        return session
+
+
+def request(provider, method, url, timeout=None, **kwargs):
+    """
+    Send a request through the provider session.
+
+    Args:
+        provider: Key of PROVIDER_TIMEOUTS (unknown keys use 'default')
+        method: HTTP method
+        url: Absolute URL
+        timeout: Override of the provider (connect, read) budget
+        **kwargs: Passed to requests.Session.request
+
+    Returns:
+        requests.Response
+    """
+    session = get_session(provider)
+    if timeout is None:
+        timeout = PROVIDER_TIMEOUTS.get(provider, PROVIDER_TIMEOUTS['default'])
+    stats = _stats[provider]
+    start = time.time()
+    try:
+        return session.request(method, url, timeout=timeout, **kwargs)
+    except requests.exceptions.RequestException:
+        stats['errors'] += 1
+        raise
+    finally:
+        stats['requests'] += 1
+        stats['elapsed'] += time.time() - start
+
+
+def get(provider, url, **kwargs):
+    return request(provider, 'GET', url, **kwargs)
+
+
+def post(provider, url, **kwargs):
+    return request(provider, 'POST', url, **kwargs)
+
+
+def delete(provider, url, **kwargs):
+    return request(provider, 'DELETE', url, **kwargs)
+
+
+def pool_stats():
+    """
+    Snapshot of the sessions of this process, for monitoring.
+
+    Returns:
+        Dict provider -> {requests, errors, avg_ms, timeout, hosts: {host: {...}}}
+        where per host `connections` is the number of TCP connections ever
+        opened (compare with `requests` to see the keep-alive reuse) and
+        `idle` the connections currently waiting in the pool.
+    """
+    pid = os.getpid()
+    result = {}
+    for provider, (session_pid, session) in list(_sessions.items()):
+        if session_pid != pid:
+            continue
+        stats = _stats.get(provider, {})
+        hosts = {}
+        for adapter in set(session.adapters.values()):
+            for key in list(adapter.poolmanager.pools.keys()):
+                pool = adapter.poolmanager.pools.get(key)
+                if pool is None:
+                    continue
+                hosts['%s://%s:%s' % (pool.scheme, pool.host, pool.port)] = {
+                    'connections': pool.num_connections,
+                    'requests': pool.num_requests,
+                    'idle': pool.pool.qsize() if pool.pool else 0,
+                    'maxsize': pool.pool.maxsize if pool.pool else 0,
+                }
+        count = stats.get('requests', 0)
+        result[provider] = {
+            'pid': pid,
+            'requests': count,
+            'errors': stats.get('errors', 0),
+            'avg_ms': round(stats.get('elapsed', 0.0) * 1000 / count, 1) if count else 0.0,
+            'timeout': PROVIDER_TIMEOUTS.get(provider, PROVIDER_TIMEOUTS['default']),
+            'hosts': hosts,
+        }
+    return result
@@ -0,0 +1 @@
+from . import outbound_http
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+from odoo import models, api, _
+from odoo.exceptions import AccessError
+
+from .. import http_client
+
+
+class OutboundHttp(models.AbstractModel):
+    """Monitoring entry point of the shared outbound HTTP sessions."""
+    _name = 'outbound.http'
+    _description = 'Outbound HTTP Pool'
+
+    @api.model
+    def get_pool_stats(self):
+        """
+        Pool statistics of the worker serving this call (RPC friendly).
+
+        Each Odoo worker process has its own pools (see the 'pid' key):
+        poll several times to cover all of them.
+        """
+        if not self.env.user.has_group('base.group_system'):
+            raise AccessError(_("Only administrators can read outbound HTTP statistics."))
+        return http_client.pool_stats()